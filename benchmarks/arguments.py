@@ -0,0 +1,63 @@
+"""Time building Arguments for the dashboards with the most parameters.
+
+Run from the repository root:
+
+    python benchmarks/arguments.py
+
+Compares building every parameter with params.Arguments against
+params.ArgumentsTemplate, which copies a template and applies only the
+parameters that differ. Best of three runs of 10,000 constructions each.
+"""
+
+import argparse
+from pathlib import Path
+import sys
+import timeit
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pracnbastats import league, params  # noqa: E402
+
+DASHBOARDS = (
+    league.PlayersDashboard,
+    league.TeamsDashboard,
+    league.PlayerTracking,
+)
+
+
+def best_time(func, number):
+    return min(timeit.repeat(func, number=number, repeat=3))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=10000)
+    args = parser.parse_args()
+    n = args.number
+    override = {'Season': params.Season(start_year=2015)}
+    for dashboard in DASHBOARDS:
+        kwargs = dashboard.table_for().api_params._dict.copy()
+        del kwargs['LeagueID']  # Always added by Arguments
+        template = params.ArgumentsTemplate()
+        full = params.Arguments(**kwargs)
+        assert template.arguments(**kwargs) == full
+        changed = {**kwargs, **override}
+        assert (
+            template.arguments(**changed) == params.Arguments(**changed)
+        )
+        times = {
+            'full': best_time(lambda: params.Arguments(**kwargs), n),
+            'template': best_time(lambda: template.arguments(**kwargs), n),
+            'one override': best_time(
+                lambda: template.arguments(**changed), n),
+        }
+        table_for = best_time(dashboard.table_for, n // 5) / (n // 5)
+        print(
+            f'{dashboard.__name__} ({len(kwargs)} params) x{n:,}: ' +
+            ', '.join(f'{k} {t * 1e3:.0f} ms' for k, t in times.items()) +
+            f'; table_for {table_for * 1e6:.0f} us'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""Time utils.as_tuples on the all players table.
+
+Run from the repository root:
+
+    python benchmarks/as_tuples.py
+
+Loads about 4,500 synthetic players, so no requests are made, and
+compares the previous itertuples path (one convert_tuple per row)
+with the column-wise zip that as_tuples now uses.
+"""
+
+import argparse
+from pathlib import Path
+import sys
+import timeit
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pracnbastats import allplayers, utils  # noqa: E402
+import synthetic  # noqa: E402
+
+
+def itertuples_path(df, to_tuple):
+    return [
+        utils.convert_tuple(to_tuple, row)
+        for row in df.itertuples(index=False)
+    ]
+
+
+def zip_path(df, to_tuple):
+    return list(utils.as_tuples(df, to_tuple))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--players', type=int, default=synthetic.N_PLAYERS)
+    parser.add_argument('--number', type=int, default=10)
+    args = parser.parse_args()
+    allplayers.load(synthetic.scraper(n_players=args.players))
+    df = allplayers.data()
+    assert (
+        itertuples_path(df, allplayers.Player) ==
+        zip_path(df, allplayers.Player)
+    )
+    times = {
+        name: min(timeit.repeat(
+            lambda: func(df, allplayers.Player),
+            number=args.number,
+            repeat=3,
+        )) / args.number
+        for name, func in (('itertuples', itertuples_path), ('zip', zip_path))
+    }
+    print(
+        f'as_tuples, {len(df):,} players: '
+        f'itertuples {times["itertuples"] * 1e3:.1f} ms, '
+        f'zip {times["zip"] * 1e3:.2f} ms '
+        f'({times["itertuples"] / times["zip"]:.0f}x)'
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""Memory used by box score frames with and without compact dtypes.
+
+Run from the repository root:
+
+    python benchmarks/compact_memory.py
+
+Uses synthetic game logs, so no requests are made. Also checks that
+compact frames for different seasons concatenate without losing their
+categorical columns.
+"""
+
+import argparse
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pandas as pd  # noqa: E402
+from pracnbastats import league, params  # noqa: E402
+import synthetic  # noqa: E402
+
+
+def box_scores(scraper, flag, years, compact):
+    return [
+        league.BoxScores(
+            scraper=scraper,
+            player_team_flag=flag,
+            season=params.Season(start_year=year),
+            compact=compact,
+        ).data
+        for year in years
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--seasons', type=int, default=3)
+    args = parser.parse_args()
+    years = range(2017 - args.seasons + 1, 2018)
+    scraper = synthetic.scraper()
+    for flag in (params.PlayerTeamFlag.Team, params.PlayerTeamFlag.Player):
+        sizes = {}
+        for compact in (False, True):
+            df = pd.concat(
+                box_scores(scraper, flag, years, compact),
+                ignore_index=True,
+            )
+            sizes[compact] = df.memory_usage(deep=True).sum() / 1e6
+        categorical = [
+            col for col in league._CATEGORIES
+            if col in df and isinstance(df[col].dtype, pd.CategoricalDtype)
+        ]
+        print(
+            f'{flag.name.lower()} logs, {len(df):,} rows: '
+            f'{sizes[False]:.2f} MB -> {sizes[True]:.2f} MB compact; '
+            f'categorical after concat: {", ".join(categorical)}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""Time `import pracnbastats` with `python -X importtime`.
+
+Run from the repository root:
+
+    python benchmarks/import_time.py
+
+Prints the total import time for each statement (best of several runs,
+each in a fresh interpreter) and which heavy dependencies it imported.
+"""
+
+import argparse
+from pathlib import Path
+import subprocess
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+
+STATEMENTS = (
+    'import pracnbastats',
+    'from pracnbastats import params',
+    'from pracnbastats import league',
+)
+HEAVY_MODULES = ('pandas', 'numpy', 'requests')
+
+
+def import_time(statement, startup=()):
+    """Total microseconds for a statement, and the modules it imported.
+
+    The total sums the cumulative times of top-level imports, which
+    includes submodules that pracnbastats imports lazily. Modules in
+    startup (imported by the interpreter itself) are not counted.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    )
+    total = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line.split('|')
+        if not cumulative.strip().isdigit():
+            continue  # Header line
+        modules.add(name.strip())
+        if not name[1:].startswith(' ') and name.strip() not in startup:
+            total += int(cumulative)
+    return total, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+    _, startup = import_time('pass')
+    for statement in STATEMENTS:
+        runs = [import_time(statement, startup) for _ in range(args.runs)]
+        best = min(total for total, _ in runs)
+        heavy = [name for name in HEAVY_MODULES if name in runs[0][1]]
+        print(f'{statement:35} {best:>10,} us  '
+              f'imports: {", ".join(heavy) or "none"}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+"""Time ratings.elo and ratings.srs, and check them against plain loops.
+
+Run from the repository root:
+
+    python benchmarks/ratings.py
+
+Uses synthetic team box score matchups (22 seasons by default), so no
+requests are made. Elo is compared with a game-by-game loop, and SRS with
+a direct ridge least-squares fit before every game date.
+"""
+
+import argparse
+from pathlib import Path
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+from pracnbastats import params, ratings, team  # noqa: E402
+import synthetic  # noqa: E402
+
+
+def matchups(years):
+    scraper = synthetic.scraper()
+    return pd.concat([
+        team.BoxScores(
+            scraper=scraper,
+            season=params.Season(start_year=year),
+        ).matchups
+        for year in years
+    ], ignore_index=True)
+
+
+def elo_loop(games):
+    """Elo ratings one game at a time, with itertuples."""
+    ratings_by_team = {}
+    season = None
+    rows = []
+    games = games.sort_values(by=['date', 'game_id'])
+    for game in games.itertuples():
+        if season is not None and game.season != season:
+            ratings_by_team = {
+                team_id: ratings.ELO_MEAN + (1 - ratings.ELO_SEASON_REVERSION)
+                * (rating - ratings.ELO_MEAN)
+                for team_id, rating in ratings_by_team.items()
+            }
+        season = game.season
+        home = ratings_by_team.get(game.team_id_h, ratings.ELO_MEAN)
+        road = ratings_by_team.get(game.team_id_r, ratings.ELO_MEAN)
+        diff = home + ratings.ELO_HOME_ADVANTAGE - road
+        expected = 1 / (1 + 10 ** (-diff / 400))
+        margin = game.pts_h - game.pts_r
+        won = margin > 0
+        multiplier = (
+            (abs(margin) + 3) ** 0.8 /
+            (7.5 + 0.006 * (diff if won else -diff))
+        )
+        shift = ratings.ELO_K * multiplier * (won - expected)
+        ratings_by_team[game.team_id_h] = home + shift
+        ratings_by_team[game.team_id_r] = road - shift
+        rows.append((home, road))
+    return np.array(rows)
+
+
+def srs_direct(games, prior_games=1.0):
+    """SRS margins from a ridge least-squares fit before each date."""
+    games = games.sort_values(by=['date', 'game_id']).reset_index(drop=True)
+    team_ids = pd.Index(pd.unique(np.concatenate([
+        games['team_id_h'].to_numpy(), games['team_id_r'].to_numpy(),
+    ])))
+    n_teams = len(team_ids)
+    home = team_ids.get_indexer(games['team_id_h'])
+    road = team_ids.get_indexer(games['team_id_r'])
+    x = np.zeros((len(games), n_teams + 1))
+    x[np.arange(len(games)), home] = 1
+    x[np.arange(len(games)), road] = -1
+    x[:, n_teams] = 1
+    y = (games['pts_h'] - games['pts_r']).to_numpy(dtype=float)
+    margins = np.zeros(len(games))
+    dates = games.groupby(['season', 'date']).groups
+    for (season, date), rows in dates.items():
+        earlier = (
+            (games['season'] == season) & (games['date'] < date)
+        ).to_numpy()
+        if not earlier.any():
+            continue
+        fitted = np.linalg.solve(
+            x[earlier].T @ x[earlier] + prior_games * np.eye(n_teams + 1),
+            x[earlier].T @ y[earlier],
+        )
+        margins[rows] = x[rows] @ fitted
+    return margins
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--seasons', type=int, default=22)
+    parser.add_argument('--check-seasons', type=int, default=2)
+    args = parser.parse_args()
+    games = matchups(range(2017 - args.seasons + 1, 2018))
+    for name, func in (('elo', ratings.elo), ('srs', ratings.srs)):
+        start = time.perf_counter()
+        func(games)
+        elapsed = time.perf_counter() - start
+        print(f'{name}: {len(games):,} games in {elapsed:.2f} s')
+    checked = games[games['season'] >= games['season'].max()
+                    - args.check_seasons + 1]
+    elo = ratings.elo(checked)
+    elo_error = np.abs(
+        elo[['elo_h', 'elo_r']].to_numpy() - elo_loop(checked)).max()
+    srs = ratings.srs(checked)
+    srs_error = np.abs(
+        srs['srs_margin_h'].to_numpy() - srs_direct(checked)).max()
+    print(f'{len(checked):,} games checked: elo max error {elo_error:.1e}, '
+          f'srs max error {srs_error:.1e}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+"""Synthetic stats.nba.com responses, for running benchmarks offline."""
+
+import datetime as dt
+import numpy as np
+from pracnbastats import scrape
+
+TEAM_ABBRS = [
+    'ATL', 'BKN', 'BOS', 'CHA', 'CHI', 'CLE', 'DAL', 'DEN', 'DET', 'GSW',
+    'HOU', 'IND', 'LAC', 'LAL', 'MEM', 'MIA', 'MIL', 'MIN', 'NOP', 'NYK',
+    'OKC', 'ORL', 'PHI', 'PHX', 'POR', 'SAC', 'SAS', 'TOR', 'UTA', 'WAS',
+]
+TEAMS = [(1610612737 + i, abbr) for i, abbr in enumerate(TEAM_ABBRS)]
+STAT_COLUMNS = [
+    'MIN', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'FTA',
+    'FT_PCT', 'OREB', 'DREB', 'REB', 'AST', 'STL', 'BLK', 'TOV', 'PF',
+]
+GAMES_PER_TEAM = 82
+N_PLAYERS = 4500  # About the size of the real all players list
+
+
+def season_games(year, *, seed=0):
+    """Regular season games as (id, date, home, road, pts_h, pts_r)."""
+    rng = np.random.default_rng(seed + year)
+    start = dt.date(year, 10, 25)
+    n_teams = len(TEAMS)
+    games = []
+    for g in range(n_teams * GAMES_PER_TEAM // 2):
+        slot = g % (n_teams // 2)
+        if slot == 0:
+            order = rng.permutation(n_teams)
+        home, road = TEAMS[order[2 * slot]], TEAMS[order[2 * slot + 1]]
+        pts_h, pts_r = rng.integers(80, 130, size=2)
+        if pts_h == pts_r:
+            pts_h += 1
+        games.append((
+            f'002{str(year)[2:]}{g + 1:05d}',
+            start + dt.timedelta(days=g // (n_teams // 2)),
+            home,
+            road,
+            int(pts_h),
+            int(pts_r),
+        ))
+    return games
+
+
+def team_rows(year, games):
+    rows = []
+    for game_id, date, home, road, pts_h, pts_r in games:
+        for (team_id, abbr), opp, pts, opp_pts, at in (
+                (home, road, pts_h, pts_r, 'vs.'),
+                (road, home, pts_r, pts_h, '@')):
+            row = {
+                'SEASON_ID': f'2{year}',
+                'TEAM_ID': team_id,
+                'TEAM_ABBREVIATION': abbr,
+                'TEAM_NAME': f'Team {abbr}',
+                'GAME_ID': game_id,
+                'GAME_DATE': date.isoformat(),
+                'MATCHUP': f'{abbr} {at} {opp[1]}',
+                'WL': 'W' if pts > opp_pts else 'L',
+            }
+            for col in STAT_COLUMNS:
+                row[col] = 0.5 if col.endswith('PCT') else 10
+            row['PTS'] = pts
+            row['PLUS_MINUS'] = pts - opp_pts
+            row['VIDEO_AVAILABLE'] = 1
+            rows.append(row)
+    return rows
+
+
+def player_rows(year, games, *, per_team):
+    rows = []
+    for team_row in team_rows(year, games):
+        for k in range(per_team):
+            row = {
+                'SEASON_ID': team_row['SEASON_ID'],
+                'PLAYER_ID': team_row['TEAM_ID'] * 100 + k,
+                'PLAYER_NAME': f'Player {k} {team_row["TEAM_ABBREVIATION"]}',
+            }
+            row.update(
+                (col, value) for col, value in team_row.items()
+                if col != 'SEASON_ID'
+            )
+            rows.append(row)
+    return rows
+
+
+def all_players(n_players):
+    return [
+        {
+            'PERSON_ID': player_id,
+            'DISPLAY_LAST_COMMA_FIRST': f'Last{player_id}, First{player_id}',
+            'DISPLAY_FIRST_LAST': f'First{player_id} Last{player_id}',
+            'ROSTERSTATUS': 1,
+            'FROM_YEAR': str(1950 + player_id % 68),
+            'TO_YEAR': str(1960 + player_id % 68),
+            'PLAYERCODE': f'player_{player_id}',
+        }
+        for player_id in range(1, n_players + 1)
+    ]
+
+
+def player_info(player_id):
+    return {
+        'PERSON_ID': player_id,
+        'POSITION': 'Guard',
+        'BIRTHDATE': '1990-01-01T00:00:00',
+        'HEIGHT': f'6-{player_id % 12}',
+        'SCHOOL': 'Duke' if player_id % 3 else ' ',
+        'COUNTRY': 'USA',
+        'DLEAGUE_FLAG': 'N',
+        'DRAFT_YEAR': str(1950 + player_id % 68),
+        'DRAFT_ROUND': '1',
+        'DRAFT_NUMBER': str(player_id % 30 + 1),
+    }
+
+
+class Session(scrape.NBASession):
+    """Answers game log and player requests with synthetic data."""
+    def __init__(self, *, players_per_team=13, n_players=N_PLAYERS):
+        super().__init__(user_agent='benchmark')
+        self._players_per_team = players_per_team
+        self._n_players = n_players
+
+    def records(self, *, api_endpoint, api_params=None, index=0):
+        request = api_params.for_request
+        if api_endpoint == 'commonallplayers':
+            return all_players(self._n_players)
+        if api_endpoint == 'commonplayerinfo':
+            return player_info(int(request['PlayerID']))
+        if api_endpoint != 'leaguegamelog':
+            raise KeyError(api_endpoint)
+        year = int(str(request['Season'])[:4])
+        games = season_games(year)
+        if request['PlayerOrTeam'] == 'P':
+            return player_rows(year, games, per_team=self._players_per_team)
+        return team_rows(year, games)
+
+
+def scraper(**kwargs):
+    """Scraper with a synthetic session and no store."""
+    return scrape.NBAScraper(session=Session(**kwargs), store=None)
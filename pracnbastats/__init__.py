@@ -2,31 +2,58 @@
 
 """
 
-# Use tqdm progress bar package (https://pypi.org/project/tqdm/)
-# This is a soft dependency; define harmless fallback if cannot import tqdm
-try:
-    from tqdm import tqdm
-except ImportError:
-    def tqdm(*args, **kwargs):
-        if args:
-            return args[0]
-        return kwargs.get('iterable', None)
-
-from . import currentteams  # noqa: F401
-from . import teamhistory  # noqa: F401
-from . import allplayers  # noqa: F401
-from . import league  # noqa: F401
-from . import team  # noqa: F401
-from . import player  # noqa: F401
-from . import params  # noqa: F401
-from . import scrape  # noqa: F401
-from . import store  # noqa: F401
-from . import table  # noqa: F401
-from . import utils  # noqa: F401
-from . import exceptions  # noqa: F401
-from . import playoffs  # noqa: F401
-
+import importlib
 import logging
+
+# Submodules are imported on first attribute access (PEP 562), so that
+#   importing the package does not import pandas, numpy or requests
+_SUBMODULES = (
+    'currentteams',
+    'teamhistory',
+    'allplayers',
+    'league',
+    'team',
+    'player',
+    'params',
+    'scrape',
+    'store',
+    'table',
+    'utils',
+    'exceptions',
+    'playoffs',
+    'ratings',
+)
+
+__all__ = list(_SUBMODULES) + ['tqdm']
+
+
+def _import_tqdm():
+    # Use tqdm progress bar package (https://pypi.org/project/tqdm/)
+    # This is a soft dependency; define harmless fallback if cannot import
+    try:
+        from tqdm import tqdm
+    except ImportError:
+        def tqdm(*args, **kwargs):
+            if args:
+                return args[0]
+            return kwargs.get('iterable', None)
+    return tqdm
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        # import_module also sets the submodule as a package attribute
+        return importlib.import_module(f'.{name}', __name__)
+    if name == 'tqdm':
+        globals()['tqdm'] = _import_tqdm()
+        return globals()['tqdm']
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
@@ -6,15 +6,20 @@ import collections
 import numpy as np
 import pandas as pd
 from . import params
+from . import scrape
+from .store import FlatFiles
 from .table import Table
 from . import utils
-from . import tqdm
 import logging
 
 log = logging.getLogger(__name__)
 
-# Singleton module variable
+CHECKPOINT_EVERY = 250  # Players fetched between checkpoint saves
+
+# Singleton module variables
 _Data = None
+_Index = None  # Lookups by player_id and code, rebuilt on load
+_Loader = scrape.LazyLoader(lambda *args, **kwargs: _load(*args, **kwargs))
 
 
 class Player(collections.namedtuple('AllPlayersRowTuple', [
@@ -35,33 +40,38 @@ class Player(collections.namedtuple('AllPlayersRowTuple', [
         return range(start_year, end_year+1)
 
 
-def data():
+def data(*, copy=False):
+    """Read-only view of the data, or a full copy if copy is True."""
     global _Data
-    return _Data.copy()
+    _Loader.ensure_loaded()
+    return _Data.copy() if copy else utils.view(_Data)
 
 
 def ids():
     """Iterator of all stats.nba.com player IDs."""
     global _Data
-    return (int(player_id) for player_id in _Data['id'])
+    _Loader.ensure_loaded()
+    return (int(player_id) for player_id in _Data['player_id'])
 
 
 def as_tuples(index=False):
     """Iterator of namedtuples for all active and historical NBA players."""
     global _Data
+    _Loader.ensure_loaded()
     return utils.as_tuples(df=_Data, to_tuple=Player, index=index)
 
 
 def select(index=False, **kwargs):
     """Single namedtuple containing data for an NBA player."""
-    global _Data
-    return utils.select_row_as_tuple(
-                df=_Data, to_tuple=Player, index=index, **kwargs)
+    global _Index
+    _Loader.ensure_loaded()
+    return _Index.select(**kwargs)
 
 
 def active(index=False):
     """NBA players active as of the most recent season."""
     global _Data
+    _Loader.ensure_loaded()
     current_year = params.Season.current_start_year()
     rows = _Data[_Data['to_year'] >= current_year]
     return utils.as_tuples(df=rows, to_tuple=Player, index=index)
@@ -70,25 +80,127 @@ def active(index=False):
 def historical(index=False):
     """NBA players no longer active as of the most recent season."""
     global _Data
+    _Loader.ensure_loaded()
     current_year = params.Season.current_start_year()
     rows = _Data[_Data['to_year'] < current_year]
     return utils.as_tuples(df=rows, to_tuple=Player, index=index)
 
 
-def load(scraper):
+def load(
+        scraper=None, *,
+        incremental=False,
+        checkpoint_every=CHECKPOINT_EVERY,
+        max_workers=scrape.DEFAULT_MAX_WORKERS):
+    """Load all players, resuming an interrupted player info crawl.
+
+    Player info is fetched concurrently (set a rate_limit on the session
+    to throttle requests), and raw results are checkpointed to a pickle
+    file in the store's directory every checkpoint_every players. The
+    checkpoint is removed once the full table has been saved, and is
+    discarded when the scraper forces a reload.
+
+    With incremental=True, a stored table is refreshed from the current
+    player list, fetching info only for new, changed and active players.
+
+    Without a scraper, the default scraper is used. Data is also loaded
+    this way automatically on first use.
+    """
+    _Loader.load(
+        scraper,
+        incremental=incremental,
+        checkpoint_every=checkpoint_every,
+        max_workers=max_workers,
+    )
+
+
+def load_in_background(scraper=None, **kwargs):
+    """Start loading all players in a background thread."""
+    return _Loader.load_in_background(scraper, **kwargs)
+
+
+def _load(
+        scraper, *,
+        incremental=False,
+        checkpoint_every=CHECKPOINT_EVERY,
+        max_workers=scrape.DEFAULT_MAX_WORKERS):
     global _Data
     table = Table(store_name='allplayers')
-    pipeline = [
-        _scrape_all_players,
-        _format_all_players,
-        _join_player_info,
-    ]
-    _Data = scraper.load_pipeline(
-        table=table,
-        pipeline=pipeline
+    checkpoint = table.derived('checkpoint')
+    store = scraper.store
+    checkpoint_store = _checkpoint_store(store)
+    if scraper.force_reload and checkpoint_store:
+        checkpoint.delete(checkpoint_store)
+    stored = None
+    if not scraper.force_reload and store and table.exists(store):
+        stored = _format_player_info(table.load(store))
+        if not incremental:
+            _set_data(stored)
+            return
+    players = _format_all_players(
+        _scrape_all_players(scraper.session), scraper.session)
+    if stored is None:
+        refresh = np.ones(len(players), dtype=bool)
+    else:
+        refresh = _refresh_mask(players, stored)
+    log.info(f'Fetching player info for {refresh.sum()} players')
+    if refresh.any():
+        info = _crawl_player_info(
+            players.loc[refresh, 'player_id'],
+            scraper.session,
+            checkpoint=checkpoint,
+            checkpoint_store=checkpoint_store,
+            checkpoint_every=checkpoint_every,
+            max_workers=max_workers,
+        )
+        updated = _join_player_info(players[refresh], info)
+    else:
+        updated = None
+    if stored is None:
+        _set_data(updated)
+    else:
+        _set_data(_merge_refreshed(players, refresh, stored, updated))
+    if store:
+        table.save(store=store, data=_Data, archive=scraper.archive)
+        checkpoint.delete(checkpoint_store)
+
+
+def _checkpoint_store(store):
+    """Pickle files next to the store, so raw values keep their types."""
+    return FlatFiles.Pickle(path=store.path) if store else None
+
+
+def _set_data(df):
+    global _Data, _Index
+    _Data = df
+    _Index = utils.RowIndex(df, Player, keys=['player_id', 'code'])
+
+
+def _refresh_mask(players, stored):
+    """Boolean mask of players that are new, changed or still active."""
+    previous = players[['player_id']].merge(
+        stored[['player_id', 'to_year']], on='player_id', how='left')
+    current_year = params.Season.current_start_year()
+    return (
+        previous['to_year'].isna().to_numpy() |
+        (previous['to_year'].to_numpy() != players['to_year'].to_numpy()) |
+        (players['to_year'].to_numpy() >= current_year)
     )
 
 
+def _merge_refreshed(players, refresh, stored, updated):
+    """Stored info for unchanged players plus refreshed rows, in list order."""
+    info_cols = ['player_id'] + [
+        col for col in stored.columns if col not in players.columns
+    ]
+    stored = stored[info_cols]
+    df = players[~refresh].merge(stored, on='player_id')
+    if updated is not None:
+        df = pd.concat([df, updated], ignore_index=True)
+    order = pd.Index(players['player_id']).get_indexer(df['player_id'])
+    df = df.iloc[np.argsort(order, kind='stable')]
+    return df.reset_index(drop=True)
+
+
 def _scrape_all_players(session):
     api_params = params.Arguments(
         Season=params.Season.default(),
@@ -113,9 +225,8 @@ def _format_all_players(df, scraper):
         'to_year',
     ]
     df = df[keep_cols]
-    df['last_name'], df['first_name'] = (
-        df['display_last_comma_first'].str.split(',', 1).str
-    )
+    names = df['display_last_comma_first'].str.split(',', n=1, expand=True)
+    df['last_name'], df['first_name'] = names[0], names[1]
     df['first_name'] = df['first_name'].str.lstrip(' ')
     df = df.drop(columns=['display_last_comma_first'])
     df = df.rename(columns={
@@ -136,18 +247,47 @@ def _scrape_player_info(player_id, session):
     )
 
 
-def _join_player_info(players, scraper):
-    players = players.copy()
-    info = []
-    for player_id in tqdm(players['player_id']):
-        player_info = _scrape_player_info(player_id, scraper)
-        if isinstance(player_info, list):
-            # For some reason, some players have more than one JSON row
-            # In my experience, these are duplicates
-            # This only keeps the first row
-            player_info = player_info[0]
-        info.append(player_info)
-    df = pd.DataFrame(info)
+def _first_player_info(player_id, session):
+    player_info = _scrape_player_info(player_id, session)
+    if isinstance(player_info, list):
+        # For some reason, some players have more than one JSON row
+        # In my experience, these are duplicates
+        # This only keeps the first row
+        player_info = player_info[0]
+    return player_info
+
+
+def _crawl_player_info(
+        player_ids, session, *,
+        checkpoint, checkpoint_store, checkpoint_every, max_workers):
+    """Raw player info rows, saving progress to a checkpoint table."""
+    store = checkpoint_store
+    if store and checkpoint.exists(store):
+        fetched = [checkpoint.load(store)]
+        done = set(fetched[0]['PERSON_ID'].astype(int))
+        log.info(f'Resuming player info crawl after {len(done)} players')
+    else:
+        fetched = []
+        done = set()
+    remaining = [
+        player_id for player_id in player_ids if int(player_id) not in done
+    ]
+    for start in range(0, len(remaining), checkpoint_every):
+        batch = remaining[start:start + checkpoint_every]
+        info = scrape.map_concurrently(
+            lambda player_id: _first_player_info(player_id, session),
+            batch,
+            max_workers=max_workers,
+        )
+        fetched.append(pd.DataFrame(info))
+        if store:
+            fetched = [pd.concat(fetched, ignore_index=True)]
+            checkpoint.save(store=store, data=fetched[0], archive=False)
+    return pd.concat(fetched, ignore_index=True)
+
+
+def _join_player_info(players, info):
+    df = info
     keep_cols = [
         'PERSON_ID',
         'POSITION',
@@ -166,14 +306,28 @@ def _join_player_info(players, scraper):
         'person_id': 'player_id',
         'dleague_flag': 'dleague',
     })
-    df['birthdate'] = pd.to_datetime(df['birthdate'])
     df['height'] = df['height'].apply(_convert_height)
-    for col in ['position', 'school', 'country']:
-        df[col] = df[col].apply(_clean_blanks)
+    df = _format_player_info(df)
+    df['player_id'] = df['player_id'].astype(players['player_id'].dtype)
     df = players.merge(df, on='player_id')
     return df.reset_index(drop=True)
 
 
+def _format_player_info(df):
+    """Player info dtypes, for fetched rows and rows read from a store.
+
+    Draft columns are nullable integers (missing for undrafted players),
+    since a CSV store reads back the API's strings as numbers.
+    """
+    df = df.copy()
+    df['birthdate'] = pd.to_datetime(df['birthdate'])
+    for col in ['draft_year', 'draft_round', 'draft_number']:
+        df[col] = pd.to_numeric(df[col], errors='coerce').astype('Int64')
+    for col in ['position', 'school', 'country']:
+        df[col] = df[col].apply(_clean_blanks).astype(object)
+    return df
+
+
 def _clean_blanks(s):
     if not s:
         return np.nan
@@ -184,7 +338,7 @@ def _clean_blanks(s):
 
 
 def _convert_height(s):
-    if '-' in s:
+    if isinstance(s, str) and '-' in s:
         feet, inches = s.split('-')
         return float(feet) + float(inches)/12
     else:
@@ -1,15 +1,17 @@
 import collections
 import pandas as pd
 from . import params
+from . import scrape
 from .table import Table
 from . import utils
-from . import tqdm
 import logging
 
 log = logging.getLogger(__name__)
 
-# Singleton module variable
+# Singleton module variables
 _Data = None
+_Index = None  # Lookups by id, abbr, code, conference and division
+_Loader = scrape.LazyLoader(lambda *args, **kwargs: _load(*args, **kwargs))
 
 
 class CurrentTeam(collections.namedtuple('CurrentTeamsRowTuple', [
@@ -25,61 +27,91 @@ class CurrentTeam(collections.namedtuple('CurrentTeamsRowTuple', [
     __slots__ = ()
 
 
-def data():
+def data(*, copy=False):
+    """Read-only view of the data, or a full copy if copy is True."""
     global _Data
-    return _Data.copy()
+    _Loader.ensure_loaded()
+    return _Data.copy() if copy else utils.view(_Data)
 
 
 def abbrs():
     global _Data
+    _Loader.ensure_loaded()
     return (team_abbr for team_abbr in _Data['abbr'])
 
 
 def ids():
     global _Data
+    _Loader.ensure_loaded()
     return (team_id for team_id in _Data['team_id'])
 
 
 def codes():
     global _Data
+    _Loader.ensure_loaded()
     return (team_code for team_code in _Data['code'])
 
 
 def as_tuples(*, index=False):
     global _Data
+    _Loader.ensure_loaded()
     return utils.as_tuples(df=_Data, to_tuple=CurrentTeam, index=index)
 
 
 def select(index=False, **kwargs):
-    global _Data
-    return utils.select_row_as_tuple(
-        df=_Data, to_tuple=CurrentTeam, index=index, **kwargs)
+    global _Index
+    _Loader.ensure_loaded()
+    return _Index.select(**kwargs)
 
 
 def conference(conf, *, index=False):
-    global _Data
-    rows = _Data[_Data['conference'] == conf]
-    return utils.as_tuples(df=rows, to_tuple=CurrentTeam, index=index)
+    global _Index
+    _Loader.ensure_loaded()
+    return iter(_Index.rows('conference', conf))
 
 
 def division(div, *, index=False):
-    global _Data
-    rows = _Data[_Data['division'] == div]
-    return utils.as_tuples(df=rows, to_tuple=CurrentTeam, index=index)
+    global _Index
+    _Loader.ensure_loaded()
+    return iter(_Index.rows('division', div))
 
 
-def load(scraper):
-    global _Data
+def load(scraper=None, *, max_workers=scrape.DEFAULT_MAX_WORKERS):
+    """Load current teams, fetching team info concurrently.
+
+    Each team's teaminfocommon response is stored as its own table, so
+    an interrupted or repeated load reuses the teams already fetched.
+
+    Without a scraper, the default scraper is used. Data is also loaded
+    this way automatically on first use.
+    """
+    _Loader.load(scraper, max_workers=max_workers)
+
+
+def load_in_background(scraper=None, **kwargs):
+    """Start loading current teams in a background thread."""
+    return _Loader.load_in_background(scraper, **kwargs)
+
+
+def _load(scraper, *, max_workers=scrape.DEFAULT_MAX_WORKERS):
+    global _Data, _Index
     table = Table(store_name='currentteams')
-    pipeline = [
-        _scrape_teams,
-        _format_teams,
-        _join_team_info,
-    ]
-    _Data = scraper.load_pipeline(
-        table=table,
-        pipeline=pipeline,
-    )
+    store = scraper.store
+    if not scraper.force_reload and store and table.exists(store):
+        _Data = table.load(store)
+    else:
+        teams = _format_teams(
+            _scrape_teams(scraper.session), scraper.session)
+        _Data = _join_team_info(teams, scraper, max_workers=max_workers)
+        if store:
+            table.save(store=store, data=_Data, archive=scraper.archive)
+    _Index = utils.RowIndex(_Data, CurrentTeam, keys=[
+        'team_id',
+        'abbr',
+        'code',
+        'conference',
+        'division',
+    ])
 
 
 def _scrape_teams(session):
@@ -105,24 +137,24 @@ def _format_teams(df, session):
     return df.reset_index(drop=True)
 
 
-def _get_summary_for_team(team_id, session):
+def _team_info_table(team_id):
     api_params = params.Arguments(
         Season=params.Season.default(),
         TeamID=team_id,
     )
-    return session.records(
+    return Table(
         api_endpoint='teaminfocommon',
         api_params=api_params,
     )
 
 
-def _join_team_info(teams, session):
-    teams = teams.copy()
-    info = []
-    for team_id in tqdm(teams['team_id']):
-        team_info = _get_summary_for_team(team_id, session)
-        info.append(team_info)
-    df = pd.DataFrame(info)
+def _join_team_info(teams, scraper, *, max_workers):
+    info = scrape.map_concurrently(
+        lambda team_id: scraper.load(table=_team_info_table(team_id)),
+        teams['team_id'],
+        max_workers=max_workers,
+    )
+    df = pd.concat(info, ignore_index=True)
     keep_cols = [
         'TEAM_ID',
         'TEAM_CODE',
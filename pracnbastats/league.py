@@ -1,5 +1,8 @@
+import collections.abc
+import itertools
 import numpy as np
 import pandas as pd
+from . import exceptions
 from . import params
 from . import scrape
 from .table import Table
@@ -7,6 +10,134 @@ import logging
 
 log = logging.getLogger(__name__)
 
+# Categorical types shared by all compact box score frames,
+#   so that frames for different seasons can be concatenated cheaply
+_TEAM_ABBRS = [
+    'ATL', 'BKN', 'BOS', 'CHA', 'CHH', 'CHI', 'CLE', 'DAL', 'DEN', 'DET',
+    'GSW', 'HOU', 'IND', 'LAC', 'LAL', 'MEM', 'MIA', 'MIL', 'MIN', 'NJN',
+    'NOH', 'NOK', 'NOP', 'NYK', 'OKC', 'ORL', 'PHI', 'PHX', 'POR', 'SAC',
+    'SAS', 'SEA', 'TOR', 'UTA', 'VAN', 'WAS',
+]
+_CATEGORIES = {
+    'season_type': pd.CategoricalDtype([
+        member.store_key for member in params.SeasonType
+    ]),
+    'team_abbr': pd.CategoricalDtype(_TEAM_ABBRS),
+    'opp_team_abbr': pd.CategoricalDtype(_TEAM_ABBRS),
+    'win_loss': pd.CategoricalDtype(['W', 'L']),
+    'home_road': pd.CategoricalDtype(['H', 'R']),
+    'video': pd.CategoricalDtype(['Y', 'N']),
+}
+_ID_COLUMNS = ['game_id', 'team_id', 'player_id']
+_PCT_COLUMNS = ['fg_pct', 'fg3_pct', 'ft_pct']
+
+# Windows (in days, including game day) for counting recent games
+SCHEDULE_WINDOWS = (5, 7)
+
+# Argument templates for the endpoints with the most parameters
+_PLAYER_TRACKING_ARGS = params.ArgumentsTemplate()
+_PLAYERS_DASHBOARD_ARGS = params.ArgumentsTemplate()
+_TEAMS_DASHBOARD_ARGS = params.ArgumentsTemplate()
+
+# Measure types combined by wide_dashboard by default
+WIDE_MEASURE_TYPES = (
+    params.MeasureType.Traditional,
+    params.MeasureType.Advanced,
+    params.MeasureType.Misc,
+    params.MeasureType.Scoring,
+    params.MeasureType.Usage,
+    params.MeasureType.Defense,
+)
+
+
+def game_log_table(
+        *,
+        player_team_flag=params.PlayerTeamFlag.default(),
+        season=params.Season.default(),
+        season_type=params.SeasonType.default(),
+        date_from=params.DateFrom.default(),
+        date_to=params.DateTo.default(),
+        sorter=params.Sorter.default(),
+        sort_direction=params.SortDirection.default(),
+        counter=params.NBACounter.default()):
+    """Table for a season of raw player or team box scores."""
+    api_params = params.Arguments(
+        PlayerOrTeam=player_team_flag,
+        Season=season,
+        SeasonType=season_type,
+        DateFrom=date_from,
+        DateTo=date_to,
+        Sorter=sorter,
+        Direction=sort_direction,
+        Counter=counter,
+    )
+    if player_team_flag == params.PlayerTeamFlag.Player:
+        unique_columns = ['GAME_ID', 'PLAYER_ID']
+    else:
+        unique_columns = ['GAME_ID', 'TEAM_ID']
+    return Table(
+        api_endpoint='leaguegamelog',
+        api_params=api_params,
+        date_column='GAME_DATE',
+        unique_columns=unique_columns,
+    )
+
+
+def game_logs_table(
+        *,
+        seasons,
+        player_team_flag=params.PlayerTeamFlag.default(),
+        season_type=params.SeasonType.default()):
+    """Table for raw box scores over seasons, named by first and last."""
+    seasons = [_as_season(season) for season in seasons]
+    years = [season.start_year for season in seasons]
+    return Table(store_name=(
+        f'leaguegamelog-{player_team_flag.store_key}-'
+        f'{season_type.store_key}-{min(years)}-{max(years)}'
+    ))
+
+
+def save_game_logs(
+        *,
+        scraper,
+        seasons,
+        player_team_flag=params.PlayerTeamFlag.default(),
+        season_type=params.SeasonType.default()):
+    """Save several seasons of raw box scores as one table.
+
+    Seasons are loaded one at a time as they are written. With a CSV
+    store, only one season is in memory; read the table back with
+    load_chunks() to keep it that way. Returns the table.
+    """
+    if not scraper.store:
+        msg = 'saving game logs needs a scraper with a store'
+        raise exceptions.NBAStatsValueException(msg)
+    seasons = [_as_season(season) for season in seasons]
+    table = game_logs_table(
+        seasons=seasons,
+        player_team_flag=player_team_flag,
+        season_type=season_type,
+    )
+    table.save_chunks(
+        store=scraper.store,
+        chunks=(
+            scraper.load(table=game_log_table(
+                player_team_flag=player_team_flag,
+                season=season,
+                season_type=season_type,
+            ))
+            for season in seasons
+        ),
+        archive=scraper.archive,
+    )
+    return table
+
+
+def _as_season(season):
+    if isinstance(season, params.Season):
+        return season
+    return params.Season(start_year=int(season))
+
 
 class BoxScores(scrape.NBAStats):
     """Player or team box scores for season across league."""
@@ -19,26 +150,28 @@ class BoxScores(scrape.NBAStats):
             date_to=params.DateTo.default(),
             sorter=params.Sorter.default(),
             sort_direction=params.SortDirection.default(),
-            counter=params.NBACounter.default()):
-        api_params = params.Arguments(
-            PlayerOrTeam=player_team_flag,
-            Season=season,
-            SeasonType=season_type,
-            DateFrom=date_from,
-            DateTo=date_to,
-            Sorter=sorter,
-            Direction=sort_direction,
-            Counter=counter,
-        )
-        table = Table(
-            api_endpoint='leaguegamelog',
-            api_params=api_params,
+            counter=params.NBACounter.default(),
+            incremental=False,
+            compact=False):
+        table = game_log_table(
+            player_team_flag=player_team_flag,
+            season=season,
+            season_type=season_type,
+            date_from=date_from,
+            date_to=date_to,
+            sorter=sorter,
+            sort_direction=sort_direction,
+            counter=counter,
         )
         super().__init__(
             scraper=scraper,
             table=table,
+            incremental=incremental,
         )
         self._data = self._format()
+        if compact:
+            self._data = BoxScores._compact(self._data)
+        self._schedule = None
 
     def select(self, home_road=None, win_loss=None):
         rows = self.data.copy()
@@ -108,30 +241,135 @@ class BoxScores(scrape.NBAStats):
         )
         df = home.join(road, lsuffix='_h', rsuffix='_r')
         df = df.reset_index()
-        df['hr_winner'] = np.where(df['win_loss_h'] == 'W', 'H', 'R')
+        home_won = (df['win_loss_h'] == 'W').to_numpy()
+        df['hr_winner'] = np.where(home_won, 'H', 'R')
+        abbr_h = df['team_abbr_h'].astype(str).to_numpy()
+        abbr_r = df['team_abbr_r'].astype(str).to_numpy()
+        df['winner'] = np.where(home_won, abbr_h, abbr_r)
+        df['loser'] = np.where(home_won, abbr_r, abbr_h)
+        margin = (df['pts_h'] - df['pts_r']).to_numpy()
+        df['mov'] = np.where(home_won, margin, -margin)
+        return df
 
-        def winner(row):
-            if row['hr_winner'] == 'H':
-                return row['team_abbr_h']
-            else:
-                return row['team_abbr_r']
-        df['winner'] = df.apply(winner, axis=1)
+    @property
+    def schedule(self):
+        """Rest and schedule features for each team and game."""
+        if self._schedule is None:
+            self._schedule = self._load_schedule()
+        return self._schedule
 
-        def loser(row):
-            if row['hr_winner'] == 'H':
-                return row['team_abbr_r']
-            else:
-                return row['team_abbr_h']
-        df['loser'] = df.apply(loser, axis=1)
+    def with_schedule(self):
+        """Box scores with schedule features for each row's team attached."""
+        keys = ['game_id', 'team_id']
+        df = self.data.copy()
+        for key in keys:
+            df[f'_{key}'] = pd.to_numeric(df[key])
+        schedule = self.schedule.drop(columns=['date']).rename(columns={
+            key: f'_{key}' for key in keys
+        })
+        df = df.merge(schedule, on=[f'_{key}' for key in keys], how='left')
+        return df.drop(columns=[f'_{key}' for key in keys])
 
-        def mov(row):
-            if row['hr_winner'] == 'H':
-                return row['pts_h'] - row['pts_r']
-            else:
-                return row['pts_r'] - row['pts_h']
-        df['mov'] = df.apply(mov, axis=1)
+    def _load_schedule(self):
+        table = self.table.derived('schedule')
+        store = self.scraper.store
+        df = None
+        if (store and not self.scraper.force_reload
+                and table.exists(store)):
+            df = table.load(store)
+            df['date'] = pd.to_datetime(df['date'])
+            if not BoxScores._same_games(df, self.data):
+                df = None  # Stale, box scores have been updated since
+        if df is None:
+            df = BoxScores._schedule_features(self.data)
+            if store:
+                table.save(store=store, data=df, archive=False)
         return df
 
+    @staticmethod
+    def _same_games(schedule, data):
+        """Whether a stored schedule has exactly the games in data.
+
+        Compares game and team IDs, dates and home or road (road games
+        have a positive road_streak), so corrected games are caught even
+        when the number of games is unchanged.
+        """
+        games = (
+            data[['game_id', 'team_id', 'date', 'home_road']]
+            .drop_duplicates(subset=['game_id', 'team_id'])
+        )
+        if len(schedule) != len(games):
+            return False
+        stored = BoxScores._game_keys(
+            schedule['game_id'],
+            schedule['team_id'],
+            schedule['date'],
+            schedule['road_streak'] > 0,
+        )
+        current = BoxScores._game_keys(
+            games['game_id'],
+            games['team_id'],
+            games['date'],
+            games['home_road'] == 'R',
+        )
+        return all(
+            np.array_equal(stored_key, current_key)
+            for stored_key, current_key in zip(stored, current)
+        )
+
+    @staticmethod
+    def _game_keys(game_id, team_id, date, road):
+        """Key arrays for each team and game, sorted by game and team."""
+        keys = [
+            pd.to_numeric(game_id).to_numpy(np.int64),
+            pd.to_numeric(team_id).to_numpy(np.int64),
+            date.to_numpy().astype('datetime64[D]'),
+            road.to_numpy(dtype=bool),
+        ]
+        order = np.lexsort((keys[1], keys[0]))
+        return [key[order] for key in keys]
+
+    @staticmethod
+    def _schedule_features(data, windows=SCHEDULE_WINDOWS):
+        """Compute rest and schedule features with one sort by team and date.
+
+        Days of rest is the number of full days off before the game, and
+        is missing for a team's first game. Counts of recent games include
+        the game itself, e.g. four games in five nights gives games_5d = 4.
+        """
+        df = (
+            data[['game_id', 'team_id', 'date', 'home_road']]
+            .drop_duplicates(subset=['game_id', 'team_id'])
+        )
+        df = pd.DataFrame({
+            'game_id': pd.to_numeric(df['game_id']).to_numpy(),
+            'team_id': pd.to_numeric(df['team_id']).to_numpy(),
+            'date': df['date'].to_numpy(),
+            'road': (df['home_road'] == 'R').to_numpy(),
+        })
+        df = df.sort_values(by=['team_id', 'date']).reset_index(drop=True)
+        teams = df.groupby(['team_id'], sort=False)
+        df['rest_days'] = teams['date'].diff().dt.days - 1
+        df['back_to_back'] = df['rest_days'] == 0
+        # Sorted (team, day) keys let searchsorted count games in a window
+        days = (
+            df['date'].to_numpy().astype('datetime64[D]').astype(np.int64)
+        )
+        team_codes = pd.factorize(df['team_id'])[0].astype(np.int64)
+        keys = team_codes * 1000000 + days
+        position = np.arange(len(df))
+        for window in windows:
+            first = np.searchsorted(keys, keys - (window - 1), side='left')
+            df[f'games_{window}d'] = position - first + 1
+        # Consecutive road games, counting this one; zero for home games
+        streak_id = (df['road'] != teams['road'].shift()).cumsum()
+        df['road_streak'] = np.where(
+            df['road'],
+            df.groupby(streak_id).cumcount() + 1,
+            0,
+        )
+        return df.drop(columns=['road'])
+
     def _format(self):
         df = self.data.copy()
         df = BoxScores._season_id(df)
@@ -153,6 +391,42 @@ class BoxScores(scrape.NBAStats):
         df['video'] = df['video'].astype('category')
         return df
 
+    @staticmethod
+    def _compact(df):
+        """Downcast columns to the smallest types that hold box score data."""
+        df = df.copy()
+        for col in df.columns:
+            if col in _CATEGORIES:
+                dtype = _CATEGORIES[col]
+                extra = set(df[col].dropna().unique()) - set(dtype.categories)
+                if extra:
+                    # The shared dtype is left alone, so frames compacted
+                    #   earlier still concatenate as categoricals
+                    log.warning(
+                        f'unknown {col} values {sorted(extra)}; '
+                        f'this frame will not share the {col} categories'
+                    )
+                    dtype = pd.CategoricalDtype(
+                        list(dtype.categories) + sorted(extra)
+                    )
+                df[col] = df[col].astype(dtype)
+            elif col in _ID_COLUMNS:
+                df[col] = df[col].astype(np.int32)
+            elif col in _PCT_COLUMNS:
+                df[col] = df[col].astype(np.float32)
+            elif col == 'season':
+                df[col] = df[col].astype(np.int16)
+            elif col == 'player_name':
+                df[col] = df[col].astype('category')
+            elif pd.api.types.is_integer_dtype(df[col]):
+                if df[col].abs().max() < np.iinfo(np.int16).max:
+                    df[col] = df[col].astype(np.int16)
+                else:
+                    df[col] = df[col].astype(np.int32)
+            elif pd.api.types.is_float_dtype(df[col]):
+                df[col] = df[col].astype(np.float32)
+        return df
+
     @staticmethod
     def _season_id(df):
         """Extract season and season type from a box score season ID."""
@@ -247,7 +521,7 @@ class PlayerTracking(scrape.NBAStats):
             counter=params.NBACounter.default(),
             sorter=params.Sorter.default(),
             sort_direction=params.SortDirection.default()):
-        api_params = params.Arguments(
+        api_params = _PLAYER_TRACKING_ARGS.arguments(
             team=team,
             PlayerOrTeam=player_team_flag,
             PtMeasureType=pt_measure_type,
@@ -338,7 +612,7 @@ class PlayersDashboard(scrape.NBAStats):
             counter=params.NBACounter.default(),
             sorter=params.Sorter.default(),
             sort_direction=params.SortDirection.default()):
-        api_params = params.Arguments(
+        api_params = _PLAYERS_DASHBOARD_ARGS.arguments(
             team=team,
             MeasureType=measure_type,
             Season=season,
@@ -422,7 +696,7 @@ class TeamsDashboard(scrape.NBAStats):
             counter=params.NBACounter.default(),
             sorter=params.Sorter.default(),
             sort_direction=params.SortDirection.default()):
-        api_params = params.Arguments(
+        api_params = _TEAMS_DASHBOARD_ARGS.arguments(
             team=team,
             MeasureType=measure_type,
             Season=season,
@@ -879,3 +1153,135 @@ class TeamsHustleDashboard(scrape.NBAStats):
             scraper=scraper,
             table=table,
         )
+
+
+class Sweep(collections.abc.Mapping):
+    """Dashboards for every combination of parameter values, loaded lazily.
+
+    Takes a dashboard class and a list of values for each of its keyword
+    arguments, e.g. measure_type=[...], season=[...]. Keys are tuples of
+    values, in the order the arguments were given. Arguments in fixed are
+    used for every combination.
+
+    Combinations are only loaded when accessed. Call fetch() to download
+    every combination that is not already stored, concurrently.
+    """
+    def __init__(self, stats_class, *, scraper, fixed=None, **grid):
+        self._stats_class = stats_class
+        self._scraper = scraper
+        self._names = tuple(grid)
+        self._kwargs = {}
+        self._tables = {}
+        for values in itertools.product(*grid.values()):
+            kwargs = dict(fixed or {})
+            kwargs.update(zip(self._names, values))
+            self._kwargs[values] = kwargs
+            self._tables[values] = stats_class.table_for(**kwargs)
+        self._loaded = {}
+
+    @property
+    def names(self):
+        """Argument names, in the order of the values in each key"""
+        return self._names
+
+    def table(self, key):
+        return self._tables[self._key(key)]
+
+    def missing(self):
+        """Keys of combinations that would need to be downloaded."""
+        store = self._scraper.store
+        return [
+            key for key, table in self._tables.items()
+            if key not in self._loaded and (
+                not store or self._scraper.force_reload
+                or not table.exists(store))
+        ]
+
+    def fetch(self, *, max_workers=scrape.DEFAULT_MAX_WORKERS):
+        """Download missing combinations concurrently, returning self.
+
+        Requests are throttled by the session's rate limit, if it has one.
+        Downloaded combinations are kept, so only those already stored are
+        read from the store when accessed.
+        """
+        missing = self.missing()
+        log.info(f'Fetching {len(missing)} of {len(self)} combinations')
+        loaded = scrape.map_concurrently(
+            self._create, missing, max_workers=max_workers)
+        self._loaded.update(zip(missing, loaded))
+        return self
+
+    def __getitem__(self, key):
+        key = self._key(key)
+        if key not in self._loaded:
+            self._loaded[key] = self._create(key)
+        return self._loaded[key]
+
+    def __iter__(self):
+        return iter(self._tables)
+
+    def __len__(self):
+        return len(self._tables)
+
+    def _key(self, key):
+        if len(self._names) == 1 and not isinstance(key, tuple):
+            key = (key,)
+        if key not in self._tables:
+            raise KeyError(key)
+        return key
+
+    def _create(self, key):
+        return self._stats_class(scraper=self._scraper, **self._kwargs[key])
+
+
+def wide_dashboard(
+        stats_class=None, *,
+        scraper,
+        measure_types=WIDE_MEASURE_TYPES,
+        id_column=None,
+        max_workers=scrape.DEFAULT_MAX_WORKERS,
+        **kwargs):
+    """One row per player (or team) with columns from several measure types.
+
+    The dashboards (PlayersDashboard by default) are fetched concurrently,
+    with any other keyword arguments passed to each. A column appearing in
+    several measure types is kept from the first one only.
+    """
+    stats_class = stats_class or PlayersDashboard
+    sweep = Sweep(
+        stats_class,
+        scraper=scraper,
+        fixed=kwargs,
+        measure_type=list(measure_types),
+    ).fetch(max_workers=max_workers)
+    frames = [sweep[measure_type].data for measure_type in measure_types]
+    return _align_columns([df for df in frames if not df.empty], id_column)
+
+
+def _align_columns(frames, id_column=None):
+    """Combine frames side by side on an ID column, allocating once."""
+    if not frames:
+        return pd.DataFrame()
+    if id_column is None:
+        id_column = 'PLAYER_ID' if 'PLAYER_ID' in frames[0] else 'TEAM_ID'
+    ids = pd.Index(np.concatenate([
+        df[id_column].to_numpy() for df in frames
+    ])).unique()
+    n = len(ids)
+    columns = {id_column: ids.to_numpy()}
+    for df in frames:
+        positions = ids.get_indexer(df[id_column])
+        complete = len(df) == n
+        for col in df.columns:
+            if col in columns:
+                continue
+            values = df[col].to_numpy()
+            if complete:
+                result = np.empty(n, dtype=values.dtype)
+            elif values.dtype.kind in 'iubf':
+                result = np.full(n, np.nan)
+            else:
+                result = np.full(n, None, dtype=object)
+            result[positions] = values
+            columns[col] = result
+    return pd.DataFrame(columns, copy=False)
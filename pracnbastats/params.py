@@ -1,6 +1,9 @@
+import copy
 from enum import Enum
 from datetime import date, datetime
 from collections import OrderedDict
+import hashlib
+import json
 from . import exceptions
 import logging
 
@@ -229,6 +232,14 @@ class Season(_Parameters):
     def __str__(self):
         return self.text
 
+    def __eq__(self, other):
+        if not isinstance(other, Season):
+            return NotImplemented
+        return self.start_year == other.start_year
+
+    def __hash__(self):
+        return hash((Season, self.start_year))
+
     # Implement expected interface methods for all NBA parameters
     # Season in a special case that needs to implement all of these
     #   since it doesn't inherit from one of the intermediate base classes
@@ -293,6 +304,17 @@ class Season(_Parameters):
 
 # Main class for grouping and passing around parameters
 
+def _canonical(for_request):
+    """Request parameters as sorted (name, text value) pairs."""
+    return tuple(sorted((str(k), str(v)) for k, v in for_request.items()))
+
+
+def fingerprint(for_request):
+    """Stable hash of request parameters, independent of their order."""
+    text = json.dumps(_canonical(for_request), separators=(',', ':'))
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
 class Arguments():
     def __init__(
             self, *,
@@ -328,6 +350,8 @@ class Arguments():
                 self._for_request.update({request_param: value})
             if hasattr(value, 'store_key'):
                 self._store_keys[request_param] = value.store_key
+            else:
+                self._store_keys.pop(request_param, None)
 
     @property
     def store_keys(self):
@@ -339,6 +363,20 @@ class Arguments():
     def __str__(self):
         return f'{self.__class__.__name__}({self._for_request})'
 
+    def __eq__(self, other):
+        if not isinstance(other, Arguments):
+            return NotImplemented
+        return _canonical(self._for_request) == _canonical(other._for_request)
+
+    def __hash__(self):
+        # Do not update() Arguments used as dict keys
+        return hash(_canonical(self._for_request))
+
+    @property
+    def fingerprint(self):
+        """Hash of all request parameters, for cache keys and file names."""
+        return fingerprint(self._for_request)
+
     def sorted_by_key(self):
         return OrderedDict(sorted(self._for_request.items()))
 
@@ -350,8 +388,53 @@ class Arguments():
         return self._dict.get(param, None)
 
     def update(self, param, value):
-        self._dict.update({param: value})
-        self._for_request.update({param: value.param})
+        self._add_params(**{param: value})
+
+    def replace(self, **kwargs):
+        """New Arguments with some parameters replaced."""
+        args = copy.copy(self)
+        args._dict = self._dict.copy()
+        args._for_request = self._for_request.copy()
+        args._store_keys = self._store_keys.copy()
+        args._add_params(**kwargs)
+        return args
+
+
+class ArgumentsTemplate():
+    """Builds Arguments for an endpoint by overriding a frozen template.
+
+    The first Arguments built become the template (normally all default
+    values). Later calls copy the template and process only the values
+    that differ from it, instead of every parameter.
+    """
+    def __init__(self):
+        self._template = None
+
+    @property
+    def template(self):
+        return self._template.replace() if self._template else None
+
+    def arguments(self, *, team=None, **kwargs):
+        if team:
+            return Arguments(team=team, **kwargs)
+        if self._template is None:
+            self._template = Arguments(**kwargs)
+            return self._template.replace()
+        current = self._template._dict
+        overrides = {
+            param: value for param, value in kwargs.items()
+            if not _same_value(current.get(param, _NO_VALUE), value)
+        }
+        return self._template.replace(**overrides)
+
+
+_NO_VALUE = object()  # Marks parameters missing from a template
+
+
+def _same_value(current, value):
+    return current is value or (
+        current is not _NO_VALUE and type(current) is type(value) and
+        current == value)
 
 
 # Parameters relating to statistics types
@@ -572,16 +655,29 @@ class PlayoffRound(_EnumBase):
     Finals = 4
 
 
-# TODO: Fix these classes to handle date logic
+# Dates are passed to the NBA API as MM/DD/YYYY strings; blank means no limit
+
+def _date_text(day):
+    """Format a date, datetime or ISO date string for the NBA API."""
+    if isinstance(day, str):
+        day = datetime.strptime(day[:10], '%Y-%m-%d')
+    return day.strftime('%m/%d/%Y')
+
 
 @DefaultEnum(default_value='')
 class DateFrom(_EnumBase):
-    pass
+    """Select games played on or after a given date."""
+    @staticmethod
+    def on(day):
+        return _date_text(day)
 
 
 @DefaultEnum(default_value='')
 class DateTo(_EnumBase):
-    pass
+    """Select games played on or before a given date."""
+    @staticmethod
+    def on(day):
+        return _date_text(day)
 
 
 # Parameters relating to league dashboard mode (team or player)
@@ -12,7 +12,9 @@ class BoxScores(league.BoxScores):
             date_to=params.DateTo.default(),
             counter=params.NBACounter.default(),
             sorter=params.Sorter.default(),
-            sort_direction=params.SortDirection.default()):
+            sort_direction=params.SortDirection.default(),
+            incremental=False,
+            compact=False):
         super().__init__(
             scraper=scraper,
             player_team_flag=params.PlayerTeamFlag.Player,
@@ -23,6 +25,8 @@ class BoxScores(league.BoxScores):
             counter=counter,
             sorter=sorter,
             sort_direction=sort_direction,
+            incremental=incremental,
+            compact=compact,
         )
         self._additional_formatting()
 
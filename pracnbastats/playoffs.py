@@ -1,17 +1,24 @@
 """NBA playoff series information and analysis"""
 
 import collections
+import concurrent.futures
+import functools
 import re
 from enum import Enum
-from itertools import permutations
+from itertools import combinations
+import numpy as np
 import pandas as pd
 from . import params
+from . import scrape
 from . import utils
 from . import team
+from . import ratings
 from . import exceptions
+from .table import Table
 
 # See https://en.wikipedia.org/wiki/NBA_playoffs#Timeline
 MIN_PLAYOFFS_YEAR = 1983  # Start of modern 16-team NBA playoffs format
+GAME_ID_LENGTH = 10  # Digits in a stats.nba.com GameID, with leading zeros
 
 
 def _enum_name(class_name):
@@ -79,7 +86,7 @@ class PlayoffSeries(collections.namedtuple('PlayoffSeriesTuple', [
     @property
     def all_game_ids(self):
         """Game IDs from stats.nba.com for historical NBA playoff series"""
-        return [int(s) for s in self.game_id.split(',')]
+        return [int(s) for s in self.game_ids.split(',')]
 
     @property
     def all_home_teams(self):
@@ -88,7 +95,7 @@ class PlayoffSeries(collections.namedtuple('PlayoffSeriesTuple', [
             TeamType.SHCA
             if team == self.series_hca
             else TeamType.OTHER
-            for team in self.home_teams.split(',')
+            for team in self.game_home_teams.split(',')
         ]
 
     @property
@@ -113,6 +120,55 @@ class PlayoffSeries(collections.namedtuple('PlayoffSeriesTuple', [
         )]
 
 
+class CompactSeries(collections.namedtuple('CompactSeriesTuple', [
+        'season',
+        'playoff_round',
+        'best_of',
+        'games_played',
+        'series_hca',
+        'series_non_hca',
+        'series_winner',
+        'outcome',
+        'game_ids',
+        'shca_home',
+        'shca_won',
+])):
+    """Historical NBA playoff series with per-game NumPy arrays
+
+    game_ids holds integer game IDs, and shca_home and shca_won are boolean
+    masks for whether the SHCA team was at home and won each game.
+    """
+    __slots__ = ()
+
+    @property
+    def all_game_ids(self):
+        return self.game_ids.tolist()
+
+    @property
+    def all_home_teams(self):
+        return [
+            TeamType.SHCA if home else TeamType.OTHER
+            for home in self.shca_home
+        ]
+
+    @property
+    def all_game_winners(self):
+        return [
+            TeamType.SHCA if won else TeamType.OTHER
+            for won in self.shca_won
+        ]
+
+    @property
+    def game_outcomes(self):
+        return [GameOutcome(
+            home_team=game[0],
+            winner=game[1],
+        ) for game in zip(
+            self.all_home_teams,
+            self.all_game_winners,
+        )]
+
+
 class SeriesFormat(Enum):
     """NBA playoff schedule from perspective of SHCA team"""
     BEST_OF_7 = ''.join(str(c) for c in (
@@ -186,6 +242,7 @@ class SeriesFormat(Enum):
             return cls.BEST_OF_7
 
 
+@functools.total_ordering
 class SeriesOutcome():
     """Representation of a particular NBA playoff series outcome"""
     def __init__(self, outcome):
@@ -196,6 +253,8 @@ class SeriesOutcome():
         return hash(self._outcome)
 
     def __eq__(self, other):
+        if not isinstance(other, SeriesOutcome):
+            return NotImplemented
         return self.outcome == other.outcome
 
     @staticmethod
@@ -234,16 +293,13 @@ class SeriesOutcome():
         return f'{self.outcome}'
 
     def __lt__(self, other):
-        if self.games_played < other.games_played:
-            return True
-        elif self.games_played > other.games_played:
-            return False
-        else:
-            for i, c in enumerate(self.outcome):
-                if c < other.outcome[i]:
-                    return True
-                elif c > other.outcome[i]:
-                    return False
+        """Order by games played, then by game winners (SHCA first)"""
+        if not isinstance(other, SeriesOutcome):
+            return NotImplemented
+        return (
+            (self.games_played, self.outcome) <
+            (other.games_played, other.outcome)
+        )
 
     @property
     def outcome(self):
@@ -293,6 +349,35 @@ class SeriesOutcome():
         ) in key
 
 
+def _outcomes_for_winner(winner, best_of):
+    """All outcomes won by a team, generated by positions of its losses"""
+    need_to_win = best_of // 2 + 1
+    if winner == TeamType.SHCA:
+        loser = TeamType.OTHER
+    else:
+        loser = TeamType.SHCA
+    outcomes = []
+    for games_played in range(need_to_win, best_of + 1):
+        # The series winner always wins the last game
+        for losses in combinations(
+                range(games_played - 1), games_played - need_to_win):
+            games = [winner.value] * games_played
+            for game in losses:
+                games[game] = loser.value
+            outcomes.append(SeriesOutcome(games))
+    return tuple(sorted(outcomes))
+
+
+# Possible outcomes for each series format and winner, built once
+_OUTCOMES = {
+    series_format: {
+        winner: _outcomes_for_winner(winner, len(series_format.value))
+        for winner in TeamType
+    }
+    for series_format in SeriesFormat
+}
+
+
 class SeriesOutcomes():
     """Representation of potential NBA playoff series outcomes"""
     def __init__(self, series_format=SeriesFormat.BEST_OF_7):
@@ -303,7 +388,6 @@ class SeriesOutcomes():
             raise exceptions.NBAStatsTypeException(msg)
         self._format = series_format
         self._best_of = len(series_format.value)
-        self._outcomes = {}
 
     @property
     def series_format(self):
@@ -325,23 +409,14 @@ class SeriesOutcomes():
 
     def outcomes(self, *, winner=None, games_played=None):
         """Possible playoff series outcomes"""
-        if winner and winner in self._outcomes:
-            outcomes = self._outcomes[winner]
-        elif winner:
-            outcomes = self._outcomes_for_winner(winner)
-            self._outcomes[winner] = outcomes
+        outcomes = _OUTCOMES[self.series_format]
+        if winner:
+            outcomes = list(outcomes[winner])
         else:
-            if TeamType.SHCA in self._outcomes:
-                shca_outcomes = self._outcomes[TeamType.SHCA]
-            else:
-                shca_outcomes = self._outcomes_for_winner(TeamType.SHCA)
-                self._outcomes[TeamType.SHCA] = shca_outcomes
-            if TeamType.OTHER in self._outcomes:
-                nonshca_outcomes = self._outcomes[TeamType.OTHER]
-            else:
-                nonshca_outcomes = self._outcomes_for_winner(TeamType.OTHER)
-                self._outcomes[TeamType.OTHER] = nonshca_outcomes
-            outcomes = shca_outcomes + nonshca_outcomes
+            outcomes = (
+                list(outcomes[TeamType.SHCA]) +
+                list(outcomes[TeamType.OTHER])
+            )
         if games_played:
             if games_played < self.need_to_win or games_played > self.best_of:
                 msg = f'invalid number of games {games_played}'
@@ -353,27 +428,165 @@ class SeriesOutcomes():
                 ]
         return outcomes
 
-    def _outcomes_for_winner(self, winner):
-        symbols = self._symbols(winner)
-        unique_outcomes = set(permutations(symbols))
-        return sorted(SeriesOutcome(outcome) for outcome in unique_outcomes)
-
-    def _symbols(self, winner):
-        win_symbol = winner.value
-        if winner == TeamType.SHCA:
-            lose_symbol = TeamType.OTHER.value
-        else:
-            lose_symbol = TeamType.SHCA.value
-        symbols = (
-            win_symbol*self.need_to_win +
-            lose_symbol*(self.best_of - self.need_to_win)
+    def probabilities(self, *, home_win_prob, road_win_prob):
+        """Exact probability of each series outcome for many matchups.
+
+        Takes the probability that the SHCA team wins a game at home and
+        on the road, as scalars or arrays with one entry per matchup.
+        Returns a DataFrame with one row per matchup and one column per
+        outcome key (e.g., 'SHCA in 5'). Each game updates the probability
+        of every (SHCA wins, OTHER wins) series state for all matchups.
+        """
+        home_win_prob, road_win_prob = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(home_win_prob, dtype=float)),
+            np.atleast_1d(np.asarray(road_win_prob, dtype=float)),
         )
-        return symbols
-
-    def _valid(self, outcome, symbol):
-        assert outcome.count(symbol) == self.need_to_win  # Sanity-check input
-        last_index = len(outcome) - outcome[::-1].index(symbol)
-        return outcome[:last_index]
+        if home_win_prob.ndim > 1:
+            msg = 'win probabilities must be scalars or one-dimensional'
+            raise exceptions.NBAStatsValueException(msg)
+        need = self.need_to_win
+        # Probability of unfinished states, indexed by [matchup, SHCA, OTHER]
+        states = np.zeros((len(home_win_prob), need, need))
+        states[:, 0, 0] = 1.0
+        probs = {}
+        for game, home_team in enumerate(self.home_teams, start=1):
+            if home_team == TeamType.SHCA:
+                p = home_win_prob[:, np.newaxis, np.newaxis]
+            else:
+                p = road_win_prob[:, np.newaxis, np.newaxis]
+            shca_won = states * p
+            other_won = states * (1 - p)
+            if game >= need:
+                probs[(TeamType.SHCA, game)] = shca_won[:, -1, :].sum(axis=1)
+                probs[(TeamType.OTHER, game)] = other_won[:, :, -1].sum(axis=1)
+            states = np.zeros_like(states)
+            states[:, 1:, :] += shca_won[:, :-1, :]
+            states[:, :, 1:] += other_won[:, :, :-1]
+        return pd.DataFrame({
+            SeriesOutcome.key_from(winner=winner, games_played=games):
+                probs[(winner, games)]
+            for winner in (TeamType.SHCA, TeamType.OTHER)
+            for games in range(need, self.best_of + 1)
+        })
+
+
+def _canonical_game_ids(game_ids):
+    """Zero-padded string game IDs; a CSV store reads them back as ints"""
+    return game_ids.astype(str).str.zfill(GAME_ID_LENGTH)
+
+
+def _series_games(matchups):
+    """Playoff games in date order, labeled by series and game number"""
+    matchups = matchups.assign(
+        game_id=_canonical_game_ids(matchups['game_id']))
+    df = matchups.sort_values(by=['date', 'game_id']).reset_index(drop=True)
+    for col in ['team_abbr_h', 'team_abbr_r', 'winner', 'loser']:
+        df[col] = df[col].astype(str)
+    home = df['team_abbr_h']
+    road = df['team_abbr_r']
+    df['matchup_id'] = (
+        home.where(home < road, road) + '_' +
+        road.where(home < road, home) + '_' +
+        df['season'].astype(str)
+    )
+    df['game_number'] = df.groupby(['matchup_id']).cumcount() + 1
+    first_cols = ['matchup_id', ]
+    cols = first_cols + [
+        col for col in df.columns if col not in first_cols
+    ]
+    return df[cols]
+
+
+def _playoff_rounds(series):
+    """Round of each series, from how many series its teams have played"""
+    teams = pd.concat([
+        series[['season', 'first_game_date', 'series_hca']]
+        .rename(columns={'series_hca': 'team'}),
+        series[['season', 'first_game_date', 'series_non_hca']]
+        .rename(columns={'series_non_hca': 'team'}),
+    ])
+    teams = teams.sort_values(by=['first_game_date'], kind='stable')
+    rounds = teams.groupby(['season', 'team']).cumcount() + 1
+    return rounds.groupby(level=0).max().reindex(series.index).astype(int)
+
+
+def _series_summary(games):
+    """One row per playoff series, with per-game lists in game order"""
+    g = games.groupby(['matchup_id'], sort=False)
+    df = pd.DataFrame({
+        'season': g['season'].first(),
+        'first_game_date': g['date'].min(),
+        'games_played': g.size(),
+        'series_hca': g['team_abbr_h'].first(),
+        'series_non_hca': g['team_abbr_r'].first(),
+        'series_winner': g['winner'].last(),
+        'game_home_teams': g['team_abbr_h'].agg(list),
+        'game_winners': g['winner'].agg(list),
+        'game_ids': g['game_id'].agg(list),
+    })
+    series_winner = games['matchup_id'].map(df['series_winner'])
+    winner_wins = (
+        (games['winner'] == series_winner)
+        .groupby(games['matchup_id'])
+        .sum()
+    )
+    df['best_of'] = np.where(winner_wins.reindex(df.index) == 3, 5, 7)
+    df = (
+        df.rename_axis('matchup_id')
+        .reset_index()
+        .sort_values(by=['first_game_date', 'matchup_id'], kind='stable')
+        .reset_index(drop=True)
+    )
+    df['playoff_round'] = _playoff_rounds(df)
+    first_cols = ['matchup_id', 'season', 'playoff_round', ]
+    cols = first_cols + [
+        col for col in PlayoffSeries._fields
+        if col not in first_cols
+    ]
+    return df[cols]
+
+
+def _compact_series(games, series):
+    """Per-game arrays for each series, and the columnar frame behind them"""
+    position = pd.Index(series['matchup_id']).get_indexer(games['matchup_id'])
+    df = pd.DataFrame({
+        'series': position,
+        'game_number': games['game_number'].to_numpy(),
+        'game_id': pd.to_numeric(games['game_id']).to_numpy(np.int64),
+        'shca_home': (
+            games['team_abbr_h'].to_numpy() ==
+            series['series_hca'].to_numpy()[position]
+        ),
+        'shca_won': (
+            games['winner'].to_numpy() ==
+            series['series_hca'].to_numpy()[position]
+        ),
+    }).sort_values(by=['series', 'game_number']).reset_index(drop=True)
+    splits = np.cumsum(series['games_played'].to_numpy())[:-1]
+    game_ids = np.split(df['game_id'].to_numpy(), splits)
+    shca_home = np.split(df['shca_home'].to_numpy(), splits)
+    shca_won = np.split(df['shca_won'].to_numpy(), splits)
+    outcomes = [
+        SeriesOutcome(np.where(won, TeamType.SHCA.value, TeamType.OTHER.value))
+        for won in shca_won
+    ]
+    tuples = [
+        CompactSeries(*fields)
+        for fields in zip(
+            series['season'],
+            series['playoff_round'],
+            series['best_of'],
+            series['games_played'],
+            series['series_hca'],
+            series['series_non_hca'],
+            series['series_winner'],
+            outcomes,
+            game_ids,
+            shca_home,
+            shca_won,
+        )
+    ]
+    return tuples, df
 
 
 class SeriesBoxScores():
@@ -386,8 +599,11 @@ class SeriesBoxScores():
             season=self._season,
             season_type=params.SeasonType.Playoffs,
         )
-        matchups = SeriesBoxScores._format_matchups(self._boxscores.matchups)
-        self._df = SeriesBoxScores._playoff_series(season, matchups)
+        games = _series_games(self._boxscores.matchups)
+        series = _series_summary(games)
+        series['season'] = season.start_year
+        self._compact, self._games = _compact_series(games, series)
+        self._df = SeriesBoxScores._playoff_series(series)
 
     @property
     def season(self):
@@ -401,95 +617,25 @@ class SeriesBoxScores():
     def data(self):
         return self._df
 
-    @staticmethod
-    def _matchup_id(season_year, abbrs):
-        abbrs = sorted(list(abbrs))
-        abbr1 = abbrs.pop(0)
-        abbr2 = abbrs.pop(0)
-        return f'{abbr1}_{abbr2}_{season_year}'
-
-    @staticmethod
-    def _create_matchup_id(row):
-        return SeriesBoxScores._matchup_id(
-            row['season'],
-            set([row['team_abbr_h'], row['team_abbr_r']])
-        )
-
-    @staticmethod
-    def _format_matchups(df):
-        df['matchup_id'] = df.apply(SeriesBoxScores._create_matchup_id, axis=1)
-        first_cols = ['matchup_id', ]
-        cols = first_cols + [
-            col for col in df.columns if col not in first_cols
-        ]
-        return df[cols].sort_values(by=['date']).reset_index(drop=True)
+    @property
+    def compact(self):
+        """Series as tuples of pre-parsed per-game arrays"""
+        return self._compact
 
-    @staticmethod
-    def _get_series_info(g):
-        results = {}
-        results['first_game_date'] = g['date'].min()
-        results['games_played'] = g['game_id'].count()
-        results['game_home_teams'] = g['team_abbr_h'].str.cat(sep=',')
-        results['series_hca'] = results['game_home_teams'].split(',')[0]
-        results['series_non_hca'] = (
-            g['team_abbr_r'].str.cat(sep=',').split(',')[0]
-        )
-        results['game_winners'] = g['winner'].str.cat(sep=',')
-        results['series_winner'] = results['game_winners'].split(',')[-1]
-        winner_won = results['game_winners'].count(results['series_winner'])
-        results['best_of'] = 5 if winner_won == 3 else 7
-        results['game_ids'] = g['game_id'].apply(str).str.cat(sep=',')
-        return pd.Series(results, index=[
-            'best_of',
-            'games_played',
-            'series_hca',
-            'series_non_hca',
-            'series_winner',
-            'game_home_teams',
-            'game_winners',
-            'first_game_date',
-            'game_ids',
-        ])
+    @property
+    def series_games(self):
+        """Columnar per-game frame; series is the row number in data"""
+        return self._games
 
     @staticmethod
-    def _playoff_rounds(df):
-        df.loc[(
-            df.index < 8),
-            'playoff_round',
-        ] = params.PlayoffRound.ConferenceQuarters.value
-        df.loc[
-            (df.index >= 8) & (df.index < 12),
-            'playoff_round',
-        ] = params.PlayoffRound.ConferenceSemis.value
-        df.loc[
-            (df.index >= 12) & (df.index < 14),
-            'playoff_round',
-        ] = params.PlayoffRound.ConferenceFinals.value
-        df.loc[
-            (df.index == 14),
-            'playoff_round',
-        ] = params.PlayoffRound.Finals.value
-        df['playoff_round'] = df['playoff_round'].astype(int)
+    def _playoff_series(series):
+        df = series.drop(columns=['matchup_id'])
+        for col in ['game_home_teams', 'game_winners', 'game_ids']:
+            df[col] = df[col].apply(
+                lambda values: ','.join(str(value) for value in values)
+            )
         return df
 
-    def _playoff_series(season, matchups):
-        df = (
-            matchups.groupby(['matchup_id'])
-            .apply(SeriesBoxScores._get_series_info)
-            .sort_values(by=['first_game_date'])
-            .reset_index()
-        )
-        df = SeriesBoxScores._playoff_rounds(df)
-        df['season'] = season.start_year
-        first_cols = ['season', 'playoff_round', ]
-        drop_cols = ['matchup_id', 'first_game_date', ]
-        cols = first_cols + [
-            col for col in df.columns
-            if col not in first_cols and
-            col not in drop_cols
-        ]
-        return df[cols]
-
     def as_tuples(self, *, index=False):
         return utils.as_tuples(
             df=self._df,
@@ -520,3 +666,443 @@ class SeriesBoxScores():
         return self.playoff_round(
             playoff_round=params.PlayoffRound.Finals.value
         )
+
+
+class SeriesHistory():
+    """NBA playoff series for every season since MIN_PLAYOFFS_YEAR
+
+    Playoff games for all seasons are stored together as one table, and
+    series are assembled from them with groupby aggregations. Per-game
+    information is kept as lists in game order, rather than as
+    comma-joined strings. Seasons missing from the stored table are
+    loaded in parallel and added to it.
+    """
+    def __init__(
+            self, *,
+            scraper, seasons=None, max_workers=scrape.DEFAULT_MAX_WORKERS):
+        if seasons is None:
+            seasons = SeriesHistory.completed_seasons()
+        seasons = [
+            season.start_year if isinstance(season, params.Season)
+            else int(season)
+            for season in seasons
+        ]
+        self._scraper = scraper
+        self._games = self._load_games(seasons, max_workers)
+        series = _series_summary(self._games)
+        self._compact, self._series_games = _compact_series(
+            self._games, series
+        )
+        self._df = series.drop(columns=['matchup_id'])
+
+    @staticmethod
+    def completed_seasons():
+        """Seasons with completed playoffs and stats.nba.com box scores"""
+        start_year = max(MIN_PLAYOFFS_YEAR, params.MIN_YEAR)
+        end_year = params.Season.current_start_year()
+        return list(range(start_year, end_year))
+
+    @property
+    def seasons(self):
+        return sorted(self._games['season'].unique().tolist())
+
+    @property
+    def games(self):
+        return self._games
+
+    @property
+    def data(self):
+        return self._df
+
+    @property
+    def compact(self):
+        """Series as tuples of pre-parsed per-game arrays"""
+        return self._compact
+
+    @property
+    def series_games(self):
+        """Columnar per-game frame; series is the row number in data"""
+        return self._series_games
+
+    def season(self, season):
+        if isinstance(season, params.Season):
+            season = season.start_year
+        return self._df[self._df['season'] == season]
+
+    def _load_games(self, seasons, max_workers):
+        scraper = self._scraper
+        table = Table(store_name='playoffserieshistory')
+        games = None
+        if (not scraper.force_reload
+                and scraper.store and table.exists(scraper.store)):
+            games = table.load(scraper.store)
+            games['date'] = pd.to_datetime(games['date'])
+            games['game_id'] = _canonical_game_ids(games['game_id'])
+            stored = set(games['season'].unique())
+            missing = [season for season in seasons if season not in stored]
+        else:
+            missing = seasons
+        if missing:
+            loaded = scrape.map_concurrently(
+                self._scrape_season,
+                missing,
+                max_workers=max_workers,
+            )
+            if games is not None:
+                loaded.insert(0, games)
+            games = (
+                pd.concat(loaded, ignore_index=True)
+                .sort_values(by=['date', 'game_id'], kind='stable')
+                .reset_index(drop=True)
+            )
+            if scraper.store:
+                table.save(
+                    store=scraper.store,
+                    data=games,
+                    archive=scraper.archive,
+                )
+        games = games[games['season'].isin(seasons)]
+        return games.reset_index(drop=True)
+
+    def _scrape_season(self, season):
+        boxscores = team.BoxScores(
+            scraper=self._scraper,
+            season=params.Season(start_year=season),
+            season_type=params.SeasonType.Playoffs,
+        )
+        return _series_games(boxscores.matchups)
+
+
+class SeriesStateCounts():
+    """Historical outcomes of playoff series from each partial series state
+
+    A series state is the series format and the number of games won so far
+    by the SHCA and OTHER teams; (0, 0) is the start of every series. Counts
+    of eventual outcomes are computed once for every state reached by the
+    series in a DataFrame like SeriesHistory.data (or SeriesBoxScores.data),
+    so that conditional queries are dictionary lookups.
+    """
+    def __init__(self, series):
+        df = series[[
+            'season',
+            'playoff_round',
+            'games_played',
+            'series_hca',
+            'series_winner',
+            'game_winners',
+        ]].reset_index(drop=True)
+        if len(df) and isinstance(df['game_winners'].iloc[0], str):
+            df['game_winners'] = df['game_winners'].str.split(',')
+        df['series_format'] = SeriesStateCounts._series_formats(df)
+        df['outcome'] = (
+            pd.Series(np.where(
+                df['series_winner'] == df['series_hca'],
+                TeamType.SHCA.name,
+                TeamType.OTHER.name,
+            )) + ' in ' + df['games_played'].astype(str)
+        )
+        games = df.explode('game_winners')
+        shca_won = (games['game_winners'] == games['series_hca']).astype(int)
+        games['shca_wins'] = shca_won.groupby(level=0).cumsum()
+        games['other_wins'] = (
+            games.groupby(level=0).cumcount() + 1 - games['shca_wins']
+        )
+        start = df[['series_format', 'outcome']].copy()
+        start['shca_wins'] = 0
+        start['other_wins'] = 0
+        states = pd.concat([start, games[start.columns]], ignore_index=True)
+        self._df = (
+            states
+            .groupby(['series_format', 'shca_wins', 'other_wins', 'outcome'])
+            .size()
+            .unstack(fill_value=0)
+        )
+        self._counts = {
+            (SeriesFormat[name], shca_wins, other_wins): {
+                key: count for key, count in row.items() if count
+            }
+            for (name, shca_wins, other_wins), row in self._df.iterrows()
+        }
+        self._totals = {
+            state: {
+                None: sum(counts.values()),
+                TeamType.SHCA: sum(
+                    count for key, count in counts.items()
+                    if SeriesOutcome.keys_match(key, winner=TeamType.SHCA)
+                ),
+                TeamType.OTHER: sum(
+                    count for key, count in counts.items()
+                    if SeriesOutcome.keys_match(key, winner=TeamType.OTHER)
+                ),
+            }
+            for state, counts in self._counts.items()
+        }
+
+    @staticmethod
+    def _series_formats(df):
+        rounds = df[['season', 'playoff_round']].drop_duplicates()
+        formats = {
+            (season, playoff_round): SeriesFormat.choose(
+                season=season,
+                playoff_round=params.PlayoffRound(playoff_round),
+            ).name
+            for season, playoff_round in rounds.itertuples(index=False)
+        }
+        return [
+            formats[(season, playoff_round)]
+            for season, playoff_round in zip(
+                df['season'], df['playoff_round'])
+        ]
+
+    @property
+    def data(self):
+        """Outcome counts by series format name and games won so far"""
+        return self._df
+
+    @staticmethod
+    def _state(series_format, shca_wins, other_wins):
+        if isinstance(series_format, str):
+            series_format = SeriesFormat.parse(series_format)
+        return (series_format, shca_wins, other_wins)
+
+    def counts(self, *, series_format, shca_wins, other_wins):
+        """Number of series with each eventual outcome from a state"""
+        state = self._state(series_format, shca_wins, other_wins)
+        return dict(self._counts.get(state, {}))
+
+    def count(
+            self, *, series_format, shca_wins, other_wins,
+            winner=None, games_played=None):
+        """Number of series from a state with a given eventual outcome"""
+        state = self._state(series_format, shca_wins, other_wins)
+        if games_played is None:
+            return self._totals.get(state, {}).get(winner, 0)
+        counts = self._counts.get(state, {})
+        if winner:
+            return counts.get(
+                SeriesOutcome.key_from(
+                    winner=winner,
+                    games_played=games_played,
+                ),
+                0,
+            )
+        return sum(
+            counts.get(SeriesOutcome.key_from(
+                winner=team_type,
+                games_played=games_played,
+            ), 0)
+            for team_type in TeamType
+        )
+
+    def probability(
+            self, *, series_format, shca_wins, other_wins,
+            winner=TeamType.SHCA, games_played=None):
+        """Historical frequency of an eventual outcome given a state"""
+        total = self.count(
+            series_format=series_format,
+            shca_wins=shca_wins,
+            other_wins=other_wins,
+        )
+        if not total:
+            return np.nan
+        return self.count(
+            series_format=series_format,
+            shca_wins=shca_wins,
+            other_wins=other_wins,
+            winner=winner,
+            games_played=games_played,
+        ) / total
+
+
+def _simulate_bracket_chunk(series_win_probs, priority, trials, seed):
+    """Count round wins by bracket slot for one chunk of simulated trials.
+
+    Slots in the bracket play their neighbors, and winners stay in the
+    earlier slot position, so each round halves the number of columns.
+    """
+    rng = np.random.default_rng(seed)
+    n_teams = len(priority)
+    teams = np.broadcast_to(np.arange(n_teams), (trials, n_teams))
+    counts = np.zeros((len(series_win_probs), n_teams), dtype=np.int64)
+    for i, win_probs in enumerate(series_win_probs):
+        first = teams[:, 0::2]
+        second = teams[:, 1::2]
+        first_hca = priority[first] >= priority[second]
+        shca = np.where(first_hca, first, second)
+        other = np.where(first_hca, second, first)
+        shca_won = rng.random(shca.shape) < win_probs[shca, other]
+        teams = np.where(shca_won, shca, other)
+        counts[i] = np.bincount(teams.ravel(), minlength=n_teams)
+    return counts
+
+
+class BracketSimulator():
+    """Monte Carlo simulation of a 16-team NBA playoff bracket
+
+    Teams are listed in bracket order, so that teams 1 and 2 meet in the
+    first round, their winner meets the winner of teams 3 and 4, and so on.
+    Game win probabilities come from Elo-style team ratings, and the team
+    with the higher home court priority (by default, rating) has series
+    home court advantage.
+    """
+    ROUNDS = [
+        params.PlayoffRound.ConferenceQuarters,
+        params.PlayoffRound.ConferenceSemis,
+        params.PlayoffRound.ConferenceFinals,
+        params.PlayoffRound.Finals,
+    ]
+    # Bracket order of conference seeds in the first round
+    SEED_ORDER = [1, 8, 4, 5, 3, 6, 2, 7]
+
+    def __init__(
+            self, *,
+            bracket,
+            team_ratings,
+            home_court=None,
+            season=params.Season.current_start_year(),
+            home_advantage=ratings.ELO_HOME_ADVANTAGE):
+        if len(bracket) != 2**len(BracketSimulator.ROUNDS):
+            msg = f'bracket has {len(bracket)} teams, not 16'
+            raise exceptions.NBAStatsValueException(msg)
+        if home_court is None:
+            home_court = team_ratings
+        self._bracket = list(bracket)
+        self._ratings = np.array(
+            [team_ratings[team] for team in bracket], dtype=float
+        )
+        self._priority = np.array(
+            [home_court[team] for team in bracket], dtype=float
+        )
+        self._season = season
+        self._home_advantage = home_advantage
+        self._series_win_probs = [
+            self._series_win_prob_matrix(
+                SeriesFormat.choose(season=season, playoff_round=rnd)
+            )
+            for rnd in BracketSimulator.ROUNDS
+        ]
+
+    @classmethod
+    def from_standings(
+            cls, team_records, *, conferences, team_ratings=None, **kwargs):
+        """Seed each conference's top eight teams by winning percentage.
+
+        team_records is a DataFrame like team.BoxScores.team_records, and
+        conferences maps team abbreviations to conference names. Without
+        explicit ratings, teams are rated by the Elo difference implied
+        by their winning percentage.
+        """
+        df = team_records.copy()
+        df['conference'] = df['team_abbr'].map(conferences)
+        win_pct = df.set_index('team_abbr')['win_pct']
+        if team_ratings is None:
+            win_pct_clipped = win_pct.clip(0.01, 0.99)
+            team_ratings = ratings.ELO_MEAN + 400 * np.log10(
+                win_pct_clipped / (1 - win_pct_clipped)
+            )
+        bracket = []
+        for _, conf in df.groupby('conference', sort=True):
+            seeds = (
+                conf.sort_values(by=['win_pct'], ascending=False)
+                ['team_abbr'].tolist()[:len(BracketSimulator.SEED_ORDER)]
+            )
+            bracket.extend(
+                seeds[seed - 1] for seed in BracketSimulator.SEED_ORDER
+            )
+        return cls(
+            bracket=bracket,
+            team_ratings=team_ratings,
+            home_court=win_pct,
+            **kwargs
+        )
+
+    @classmethod
+    def from_series(cls, series_box_scores, *, team_ratings, **kwargs):
+        """Bracket of the actual playoff series for a historical season."""
+        df = series_box_scores.data
+
+        def teams(abbr, playoff_round):
+            series = df[
+                (df['playoff_round'] == playoff_round) &
+                ((df['series_hca'] == abbr) | (df['series_non_hca'] == abbr))
+            ].iloc[0]
+            pair = [series['series_hca'], series['series_non_hca']]
+            if playoff_round == BracketSimulator.ROUNDS[0].value:
+                return pair
+            return teams(pair[0], playoff_round - 1) + teams(
+                pair[1], playoff_round - 1
+            )
+        finals = params.PlayoffRound.Finals.value
+        finals_team = df.loc[df['playoff_round'] == finals, 'series_hca']
+        season = series_box_scores.season
+        if isinstance(season, params.Season):
+            season = season.start_year
+        kwargs.setdefault('season', season)
+        return cls(
+            bracket=teams(finals_team.iloc[0], finals),
+            team_ratings=team_ratings,
+            **kwargs
+        )
+
+    @property
+    def bracket(self):
+        return self._bracket
+
+    @property
+    def season(self):
+        return self._season
+
+    def _series_win_prob_matrix(self, series_format):
+        """Probability that row team (with SHCA) beats column team."""
+        n = len(self._bracket)
+        shca, other = np.divmod(np.arange(n * n), n)
+        diff = self._ratings[shca] - self._ratings[other]
+        probs = SeriesOutcomes(series_format).probabilities(
+            home_win_prob=1 / (1 + 10**(-(diff + self._home_advantage)/400)),
+            road_win_prob=1 / (1 + 10**(-(diff - self._home_advantage)/400)),
+        )
+        shca_cols = [
+            col for col in probs.columns
+            if SeriesOutcome.keys_match(col, winner=TeamType.SHCA)
+        ]
+        return probs[shca_cols].sum(axis=1).to_numpy().reshape(n, n)
+
+    def simulate(
+            self, trials, *, seed=None, chunk_size=100000, processes=None):
+        """Probability of each team winning each playoff round.
+
+        Trials are run in chunks of at most chunk_size, to bound memory.
+        If processes is given, chunks are run in that many processes.
+        Results for a given seed do not depend upon the number of
+        processes.
+        """
+        if trials < 1 or chunk_size < 1:
+            msg = (
+                f'need at least one trial and a chunk_size of at least one, '
+                f'not trials={trials} and chunk_size={chunk_size}'
+            )
+            raise exceptions.NBAStatsValueException(msg)
+        sizes = [chunk_size] * (trials // chunk_size)
+        if trials % chunk_size:
+            sizes.append(trials % chunk_size)
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+        args = (
+            [self._series_win_probs] * len(sizes),
+            [self._priority] * len(sizes),
+            sizes,
+            seeds,
+        )
+        if processes:
+            with concurrent.futures.ProcessPoolExecutor(processes) as pool:
+                counts = sum(pool.map(_simulate_bracket_chunk, *args))
+        else:
+            counts = sum(map(_simulate_bracket_chunk, *args))
+        df = pd.DataFrame(
+            counts.T / trials,
+            index=pd.Index(self._bracket, name='team_abbr'),
+            columns=[rnd.name for rnd in BracketSimulator.ROUNDS],
+        )
+        return df.sort_values(
+            by=[rnd.name for rnd in reversed(BracketSimulator.ROUNDS)],
+            ascending=False,
+        )
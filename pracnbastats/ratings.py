@@ -0,0 +1,173 @@
+"""Game-by-game NBA team ratings computed from box score matchups.
+
+Both rating systems take the matchups DataFrame from team.BoxScores (or
+several seasons of them concatenated), and return one row per game with
+each team's rating before the game was played.
+
+Games are processed one date at a time. Because a team plays at most once
+on any date, all of the games on a date can be rated simultaneously with
+NumPy arrays indexed by team.
+"""
+
+import numpy as np
+import pandas as pd
+from . import exceptions
+import logging
+
+log = logging.getLogger(__name__)
+
+ELO_MEAN = 1505.0  # Long-run average Elo rating
+ELO_K = 20.0  # Elo update speed
+ELO_HOME_ADVANTAGE = 100.0  # Home court advantage in Elo points
+ELO_SEASON_REVERSION = 0.25  # Fraction reverted to mean between seasons
+
+
+class _Schedule():
+    """Matchups sorted by date, with teams encoded as array indices."""
+    def __init__(self, matchups):
+        df = matchups.sort_values(by=['date', 'game_id'])
+        self.games = df[[
+            'season',
+            'season_type',
+            'game_id',
+            'date',
+            'team_id_h',
+            'team_abbr_h',
+            'team_id_r',
+            'team_abbr_r',
+        ]].reset_index(drop=True)
+        n = len(df)
+        codes, self.team_ids = pd.factorize(np.concatenate([
+            df['team_id_h'].to_numpy(),
+            df['team_id_r'].to_numpy(),
+        ]))
+        self.home = codes[:n]
+        self.road = codes[n:]
+        self.margin = (
+            df['pts_h'].to_numpy(dtype=float) -
+            df['pts_r'].to_numpy(dtype=float)
+        )
+        played = pd.DataFrame({
+            'date': np.concatenate([df['date'].to_numpy()] * 2),
+            'team': codes,
+        })
+        if played.duplicated().any():
+            msg = 'matchups have a team playing more than once on a date'
+            raise exceptions.NBAStatsValueException(msg)
+        dates = df['date'].to_numpy()
+        seasons = df['season'].to_numpy()
+        self.starts = np.flatnonzero(np.r_[True, dates[1:] != dates[:-1]])
+        self.ends = np.r_[self.starts[1:], n]
+        self.new_season = np.r_[
+            True,
+            seasons[self.starts[1:]] != seasons[self.starts[:-1]],
+        ]
+
+    @property
+    def n_teams(self):
+        return len(self.team_ids)
+
+    def batches(self):
+        """Index slice for each date, and whether it starts a new season."""
+        for start, end, new_season in zip(
+                self.starts, self.ends, self.new_season):
+            yield slice(start, end), new_season
+
+
+def elo(
+        matchups, *,
+        k=ELO_K,
+        home_advantage=ELO_HOME_ADVANTAGE,
+        mean=ELO_MEAN,
+        season_reversion=ELO_SEASON_REVERSION,
+        mov_multiplier=True):
+    """Sequential Elo ratings for every game in a matchups DataFrame."""
+    schedule = _Schedule(matchups)
+    n = len(schedule.games)
+    ratings = np.full(schedule.n_teams, mean)
+    pre_h = np.empty(n)
+    pre_r = np.empty(n)
+    prob_h = np.empty(n)
+    first_season = True
+    for games, new_season in schedule.batches():
+        if new_season and not first_season:
+            ratings = mean + (1 - season_reversion) * (ratings - mean)
+        first_season = False
+        home = schedule.home[games]
+        road = schedule.road[games]
+        margin = schedule.margin[games]
+        diff = ratings[home] + home_advantage - ratings[road]
+        expected = 1 / (1 + 10 ** (-diff / 400))
+        won = margin > 0
+        if mov_multiplier:
+            # Smaller updates for expected blowouts by stronger teams
+            winner_diff = np.where(won, diff, -diff)
+            multiplier = (
+                (np.abs(margin) + 3) ** 0.8 / (7.5 + 0.006 * winner_diff)
+            )
+        else:
+            multiplier = 1.0
+        shift = k * multiplier * (won - expected)
+        pre_h[games] = ratings[home]
+        pre_r[games] = ratings[road]
+        prob_h[games] = expected
+        ratings[home] += shift
+        ratings[road] -= shift
+    df = schedule.games.copy()
+    df['elo_h'] = pre_h
+    df['elo_r'] = pre_r
+    df['elo_prob_h'] = prob_h
+    return df
+
+
+def srs(matchups, *, prior_games=1.0):
+    """Season-to-date least-squares margin of victory ratings by game.
+
+    Ratings and home court advantage before each game are fit to all
+    earlier games that season. The prior shrinks ratings toward zero
+    (average), which matters only early in the season.
+    """
+    schedule = _Schedule(matchups)
+    n = len(schedule.games)
+    n_teams = schedule.n_teams
+    hca = n_teams  # Home court advantage is the final coefficient
+    size = n_teams + 1
+    pre_h = np.zeros(n)
+    pre_r = np.zeros(n)
+    pre_hca = np.zeros(n)
+    # Normal equations for (rating_h - rating_r + hca) ~ margin_h
+    xtx = np.zeros((size, size))
+    xty = np.zeros(size)
+    fitted = np.zeros(size)
+    prior = prior_games * np.eye(size)
+    for games, new_season in schedule.batches():
+        if new_season:
+            xtx[:] = 0
+            xty[:] = 0
+            fitted[:] = 0
+        elif xty.any():
+            fitted = np.linalg.solve(xtx + prior, xty)
+        home = schedule.home[games]
+        road = schedule.road[games]
+        margin = schedule.margin[games]
+        pre_h[games] = fitted[home]
+        pre_r[games] = fitted[road]
+        pre_hca[games] = fitted[hca]
+        np.add.at(xtx, (home, home), 1)
+        np.add.at(xtx, (road, road), 1)
+        np.add.at(xtx, (home, road), -1)
+        np.add.at(xtx, (road, home), -1)
+        np.add.at(xtx, (home, hca), 1)
+        np.add.at(xtx, (hca, home), 1)
+        np.add.at(xtx, (road, hca), -1)
+        np.add.at(xtx, (hca, road), -1)
+        xtx[hca, hca] += len(margin)
+        np.add.at(xty, home, margin)
+        np.add.at(xty, road, -margin)
+        xty[hca] += margin.sum()
+    df = schedule.games.copy()
+    df['srs_h'] = pre_h
+    df['srs_r'] = pre_r
+    df['srs_hca'] = pre_hca
+    df['srs_margin_h'] = pre_h - pre_r + pre_hca
+    return df
@@ -1,12 +1,125 @@
 from collections import OrderedDict
+import concurrent.futures
+import importlib
 import logging
+import threading
+import time
 import requests
 import pandas as pd
 from . import params
 from . import exceptions
+from . import utils
+from . import tqdm
 
 log = logging.getLogger(__name__)
 
+DEFAULT_MAX_WORKERS = 8  # Concurrent requests for multi-request stages
+
+# Scraper for loading reference data on first use (see set_default_scraper)
+_default_scraper = None
+_lazy_loaders = []
+# Modules whose reference data is loaded lazily, registering their loaders
+_REFERENCE_MODULES = ('currentteams', 'teamhistory', 'allplayers')
+
+
+def set_default_scraper(scraper, *, preload=False):
+    """Set the scraper for loading reference data on first use.
+
+    With preload=True, all reference data starts loading in the background.
+    """
+    global _default_scraper
+    _default_scraper = scraper
+    if preload:
+        # Submodules are imported lazily, so loaders may not be registered
+        for name in _REFERENCE_MODULES:
+            importlib.import_module(f'.{name}', __package__)
+        for loader in _lazy_loaders:
+            loader.ensure_loaded_in_background()
+
+
+def default_scraper():
+    global _default_scraper
+    if _default_scraper is None:
+        msg = (
+            'reference data not loaded and no default scraper set; '
+            'call load() or scrape.set_default_scraper() first'
+        )
+        raise exceptions.NBAStatsException(msg)
+    return _default_scraper
+
+
+class LazyLoader():
+    """Load a module's data once, on first use or in a background thread.
+
+    A lock makes concurrent first uses wait for a single load.
+    """
+    def __init__(self, load):
+        self._load = load
+        self._lock = threading.Lock()
+        self._loaded = False
+        _lazy_loaders.append(self)
+
+    @property
+    def loaded(self):
+        return self._loaded
+
+    def load(self, scraper=None, **kwargs):
+        """Load now, with the default scraper if none is given."""
+        with self._lock:
+            self._load(scraper or default_scraper(), **kwargs)
+            self._loaded = True
+
+    def ensure_loaded(self):
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self._load(default_scraper())
+                    self._loaded = True
+
+    def load_in_background(self, scraper=None, **kwargs):
+        return self._in_background(self.load, scraper, **kwargs)
+
+    def ensure_loaded_in_background(self):
+        return self._in_background(self.ensure_loaded)
+
+    @staticmethod
+    def _in_background(func, *args, **kwargs):
+        def run():
+            try:
+                func(*args, **kwargs)
+            except Exception:
+                log.exception('background load failed')
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        return thread
+
+
+class RateLimiter():
+    """Space out calls, across threads, to at most a given rate per second."""
+    def __init__(self, rate):
+        self._interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next = time.monotonic()
+
+    @property
+    def rate(self):
+        return 1.0 / self._interval
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self._interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+def map_concurrently(func, items, *, max_workers=DEFAULT_MAX_WORKERS):
+    """Apply func to items in a thread pool, returning results in order."""
+    items = list(items)
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as pool:
+        return list(tqdm(pool.map(func, items), total=len(items)))
+
 
 class NBASession():
     DEFAULT_BASE_URL = 'http://stats.nba.com/stats'
@@ -21,10 +134,29 @@ class NBASession():
         'connection': 'keep-alive',
     }
 
-    def __init__(self, *, user_agent, referer=DEFAULT_REFERER):
-        self._headers = NBASession.REQUEST_HEADERS
+    def __init__(
+            self, *,
+            user_agent,
+            referer=DEFAULT_REFERER,
+            rate_limit=None,
+            pool_size=DEFAULT_MAX_WORKERS):
+        self._headers = dict(NBASession.REQUEST_HEADERS)
         self._headers['user-agent'] = user_agent
         self._headers['referer'] = referer
+        # Keep-alive connections shared by all requests (and threads)
+        self._http = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=pool_size)
+        self._http.mount('http://', adapter)
+        self._http.mount('https://', adapter)
+        if rate_limit:
+            self._limiter = RateLimiter(rate_limit)
+        else:
+            self._limiter = None
+
+    @property
+    def rate_limit(self):
+        """Maximum requests per second, or None if unlimited"""
+        return self._limiter.rate if self._limiter else None
 
     def get(self, *,
             base_url=None, api_endpoint, headers=None, api_params=None,
@@ -36,8 +168,10 @@ class NBASession():
             headers = self._headers
         if isinstance(api_params, params.Arguments):
             api_params = api_params.for_request
+        if self._limiter:
+            self._limiter.wait()
         try:
-            response = requests.get(
+            response = self._http.get(
                 url,
                 headers=headers,
                 params=api_params,
@@ -75,7 +209,8 @@ class NBASession():
         except KeyError:
             headers = NBASession._headers(json[results]['headers'])
             rows = json[results]['rowSet']
-        assert len(headers) == len(rows[0])
+        if rows:
+            assert len(headers) == len(rows[0])
         if len(rows) > 1:
             return [OrderedDict(zip(headers, row)) for row in rows]
         elif len(rows) == 1:
@@ -104,11 +239,21 @@ class NBASession():
 
 
 class NBAScraper():
-    def __init__(self, *, session, store, force_reload=False, archive=True):
+    def __init__(
+            self, *,
+            session,
+            store,
+            force_reload=False,
+            archive=True,
+            memory_cache=False):
         self._session = session
         self._store = store
         self._force_reload = force_reload
         self._archive = archive
+        # Responses by request key; identical concurrent requests share one
+        self._memory_cache = {} if memory_cache else None
+        self._pending = {}
+        self._lock = threading.Lock()
 
     @property
     def session(self):
@@ -134,7 +279,60 @@ class NBAScraper():
     def archive(self, value):
         self._archive = value
 
+    @staticmethod
+    def request_key(*, api_endpoint, api_params=None, index=0):
+        """Hashable key identifying a request and its result set."""
+        if isinstance(api_params, params.Arguments):
+            digest = api_params.fingerprint
+        else:
+            digest = params.fingerprint(api_params or {})
+        return (api_endpoint, digest, index)
+
+    def clear_memory_cache(self):
+        with self._lock:
+            if self._memory_cache is not None:
+                self._memory_cache.clear()
+
     def get(self, *, api_endpoint, api_params=None, index=0):
+        """Fetch a DataFrame, sharing results of identical requests.
+
+        Identical requests made while one is in flight wait for its result.
+        With memory_cache, results are also kept for later requests.
+        """
+        key = NBAScraper.request_key(
+            api_endpoint=api_endpoint,
+            api_params=api_params,
+            index=index,
+        )
+        with self._lock:
+            if self._memory_cache is not None and key in self._memory_cache:
+                return utils.view(self._memory_cache[key])
+            future = self._pending.get(key)
+            fetching = future is None
+            if fetching:
+                future = concurrent.futures.Future()
+                self._pending[key] = future
+        if not fetching:
+            return utils.view(future.result())
+        try:
+            df = self._fetch(
+                api_endpoint=api_endpoint,
+                api_params=api_params,
+                index=index,
+            )
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._pending[key]
+        with self._lock:
+            if self._memory_cache is not None:
+                self._memory_cache[key] = df
+        future.set_result(df)
+        return utils.view(df)
+
+    def _fetch(self, *, api_endpoint, api_params=None, index=0):
         records = self.session.records(
             api_endpoint=api_endpoint,
             api_params=api_params,
@@ -142,8 +340,10 @@ class NBAScraper():
         )
         if isinstance(records, list):
             df = pd.DataFrame(records)
+        elif records is None:
+            df = pd.DataFrame()
         else:
-            df = pd.DataFrame(list(records))
+            df = pd.DataFrame([records])
         return df
 
     def load(self, *, table):
@@ -159,6 +359,39 @@ class NBAScraper():
             table.save(store=self.store, data=df, archive=self.archive)
         return df
 
+    def load_incremental(self, *, table):
+        """Load table, fetching only records since the last stored date.
+
+        The most recent stored date is fetched again, since games on that
+        date may not all have been final when the table was last saved.
+        """
+        if self.force_reload or not self.store or not table.exists(self.store):
+            return self.load(table=table)
+        stored = table.load(self.store)
+        if stored.empty:
+            return self.load(table=table)
+        last_date = pd.to_datetime(stored[table.date_column]).max()
+        api_params = table.api_params.replace(
+            DateFrom=params.DateFrom.on(last_date),
+        )
+        df = self.get(
+            api_endpoint=table.api_endpoint,
+            api_params=api_params,
+            index=table.index,
+        )
+        if df.empty:
+            return stored
+        # Match stored key types (e.g., CSV files drop leading zeros in IDs)
+        keys = table.unique_columns
+        df = df.astype(stored.dtypes[keys].to_dict())
+        df = (
+            pd.concat([stored, df], ignore_index=True)
+            .drop_duplicates(subset=keys, keep='last')
+            .reset_index(drop=True)
+        )
+        table.save(store=self.store, data=df, archive=self.archive)
+        return df
+
     def load_pipeline(self, *, table, pipeline):
         if not self.force_reload and self.store and table.exists(self.store):
             df = table.load(self.store)
@@ -173,13 +406,46 @@ class NBAScraper():
         return df
 
 
+class _TableRecorder():
+    """Stands in for a scraper to capture the table an object would load."""
+    store = None
+    force_reload = False
+    archive = False
+
+    def __init__(self):
+        self.table = None
+
+    def load(self, *, table):
+        self.table = table
+        return pd.DataFrame()
+
+    def load_incremental(self, *, table):
+        return self.load(table=table)
+
+
 class NBAStats():
-    def __init__(self, *, scraper, table):
+    def __init__(self, *, scraper, table, incremental=False):
         self._scraper = scraper
         self._table = table
-        self._data = self.scraper.load(
-            table=table,
-        )
+        if incremental:
+            self._data = self.scraper.load_incremental(
+                table=table,
+            )
+        else:
+            self._data = self.scraper.load(
+                table=table,
+            )
+
+    @classmethod
+    def table_for(cls, **kwargs):
+        """Table an instance created with these arguments would load.
+
+        Works for classes that do nothing with their data on creation
+        besides loading it (e.g., the league dashboards).
+        """
+        recorder = _TableRecorder()
+        cls(scraper=recorder, **kwargs)
+        return recorder.table
 
     @property
     def scraper(self):
@@ -1,23 +1,36 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
+import os
 from pathlib import Path
 import shutil
 import pandas as pd
+from . import utils
+
+
+MAX_FILENAME_LENGTH = 255  # Common filesystem limit, in bytes
+FINGERPRINT_LENGTH = 16  # Hex digits of the parameter hash in file names
 
 
 def _build_filename(prefix, table, suffix):
+    """File name with readable store keys and a hash of all parameters.
+
+    Tables that differ only in parameters without store keys get different
+    hashes. The readable part is truncated if the name would be too long.
+    """
+    name = f'{prefix}-{table.api_endpoint}'
     if table.store_keys:
         keys = '-'.join(
             f'{key}({value})'
-            for key, value in table.store_keys.items()
+            for key, value in sorted(table.store_keys.items())
         )
+        name = f'{name}-{keys}'
+    if table.api_params is not None:
+        digest = table.api_params.fingerprint[:FINGERPRINT_LENGTH]
+        ending = f'-{digest}.{suffix}'
     else:
-        keys = None
-    if keys:
-        filename = f'{prefix}-{table.api_endpoint}-{keys}.{suffix}'
-    else:
-        filename = f'{prefix}-{table.api_endpoint}.{suffix}'
-    return filename
+        ending = f'.{suffix}'
+    name = name.encode('utf-8')[:MAX_FILENAME_LENGTH - len(ending)]
+    return name.decode('utf-8', errors='ignore') + ending
 
 
 def _archive(file):
@@ -45,21 +58,42 @@ class _StorageBase(ABC):
         pass
 
     @abstractmethod
-    def load(self, locator, **kwargs):
+    def load(self, locator, columns=None, **kwargs):
         pass
 
     @abstractmethod
     def save(self, locator, archive=True, **kwargs):
         pass
 
+    @abstractmethod
+    def load_chunks(self, locator, rows, **kwargs):
+        pass
+
+    @abstractmethod
+    def save_chunks(self, locator, chunks, archive=True, **kwargs):
+        pass
+
+    @abstractmethod
+    def delete(self, locator, **kwargs):
+        pass
+
 
 class FlatFiles(_StorageBase):
     """Store NBA statistics in one or more flat files."""
-    def __init__(self, *, path, suffix, loader, saver):
+    def __init__(
+            self, *,
+            path,
+            suffix,
+            loader,
+            saver,
+            chunk_loader,
+            chunk_saver):
         self._prefix = 'pracnbastats'
         self._suffix = suffix
         self._loader = loader
         self._saver = saver
+        self._chunk_loader = chunk_loader
+        self._chunk_saver = chunk_saver
         super().__init__(path=path)
 
     def locator(self, table):
@@ -76,37 +110,91 @@ class FlatFiles(_StorageBase):
     def exists(self, locator):
         return locator.exists()
 
-    def load(self, locator):
-        return self._loader(locator)
+    def load(self, locator, columns=None):
+        return self._loader(locator, columns)
 
     def save(self, locator, data, archive=True):
         if self.exists(locator) and archive:
             _archive(locator)
         self._saver(data, locator)
 
+    def load_chunks(self, locator, rows):
+        return self._chunk_loader(locator, rows)
+
+    def save_chunks(self, locator, chunks, archive=True):
+        if self.exists(locator) and archive:
+            _archive(locator)
+        # Write beside the file and swap it in, so a chunk iterator that
+        #   fails part way leaves the stored table as it was
+        temp = locator.with_name(f'{locator.name}.tmp')
+        try:
+            self._chunk_saver(chunks, temp)
+            os.replace(temp, locator)
+        finally:
+            if temp.exists():
+                temp.unlink()
+
+    def delete(self, locator):
+        if self.exists(locator):
+            locator.unlink()
+
     @staticmethod
-    def _csv_loader(file):
-        return pd.read_csv(file)
+    def _csv_loader(file, columns=None):
+        if columns is None:
+            return pd.read_csv(file)
+        return pd.read_csv(file, usecols=columns)[columns]
 
     @staticmethod
     def _csv_saver(data, file):
         data.to_csv(file, index=False, na_rep='NaN', float_format='%.4f')
 
     @staticmethod
-    def _pkl_loader(file):
-        return pd.read_pickle(file)
+    def _csv_chunk_loader(file, rows):
+        with pd.read_csv(file, chunksize=rows) as reader:
+            yield from reader
+
+    @staticmethod
+    def _csv_chunk_saver(chunks, file):
+        """Append chunks to the file, so only one is in memory at a time."""
+        header = True
+        with open(file, 'w', newline='') as f:
+            for chunk in chunks:
+                chunk.to_csv(
+                    f,
+                    header=header,
+                    index=False,
+                    na_rep='NaN',
+                    float_format='%.4f',
+                )
+                header = False
+
+    @staticmethod
+    def _pkl_loader(file, columns=None):
+        df = pd.read_pickle(file)
+        return df if columns is None else df[columns]
 
     @staticmethod
     def _pkl_saver(data, file):
         data.to_pickle(file)
 
+    @staticmethod
+    def _pkl_chunk_loader(file, rows):
+        # Pickles can only be read whole
+        yield from utils.chunks(pd.read_pickle(file), rows=rows)
+
+    @staticmethod
+    def _pkl_chunk_saver(chunks, file):
+        pd.concat(chunks, ignore_index=True).to_pickle(file)
+
     @classmethod
     def CSV(cls, *, path):
         return cls(
             path=path,
             suffix='csv',
             loader=FlatFiles._csv_loader,
-            saver=FlatFiles._csv_saver
+            saver=FlatFiles._csv_saver,
+            chunk_loader=FlatFiles._csv_chunk_loader,
+            chunk_saver=FlatFiles._csv_chunk_saver,
         )
 
     @classmethod
@@ -115,5 +203,7 @@ class FlatFiles(_StorageBase):
             path=path,
             suffix='pkl',
             loader=FlatFiles._pkl_loader,
-            saver=FlatFiles._pkl_saver
+            saver=FlatFiles._pkl_saver,
+            chunk_loader=FlatFiles._pkl_chunk_loader,
+            chunk_saver=FlatFiles._pkl_chunk_saver,
         )
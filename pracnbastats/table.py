@@ -4,10 +4,14 @@ from . import exceptions
 class Table():
     def __init__(
             self, *,
-            store_name=None, api_endpoint=None, api_params=None, index=0):
+            store_name=None, api_endpoint=None, api_params=None, index=0,
+            date_column=None, unique_columns=None):
         self._api_endpoint = api_endpoint
         self._api_params = api_params
         self._index = index
+        # Needed only for tables which can be updated incrementally
+        self._date_column = date_column
+        self._unique_columns = unique_columns
         if store_name:
             self._store_name = store_name
         elif not self.api_endpoint:
@@ -46,11 +50,35 @@ class Table():
     def index(self):
         return self._index
 
+    @property
+    def date_column(self):
+        return self._date_column
+
+    @property
+    def unique_columns(self):
+        return self._unique_columns
+
+    def derived(self, name):
+        """Table for data derived from this one, stored alongside it."""
+        if self.store_name:
+            return Table(store_name=f'{self.store_name}-{name}')
+        return Table(
+            api_endpoint=f'{self.api_endpoint}-{name}',
+            api_params=self.api_params,
+        )
+
     def exists(self, store):
         return store.exists(locator=store.locator(table=self))
 
-    def load(self, store):
-        return store.load(locator=store.locator(table=self))
+    def load(self, store, columns=None):
+        return store.load(locator=store.locator(table=self), columns=columns)
+
+    def load_chunks(self, store, *, rows):
+        """Iterate over the stored table in chunks of rows."""
+        return store.load_chunks(locator=store.locator(table=self), rows=rows)
+
+    def delete(self, store):
+        store.delete(locator=store.locator(table=self))
 
     def save(self, *, store, data, archive=True):
         store.save(
@@ -58,3 +86,11 @@ class Table():
             data=data,
             archive=archive
         )
+
+    def save_chunks(self, *, store, chunks, archive=True):
+        """Save an iterable of DataFrame chunks (e.g., one per season)."""
+        store.save_chunks(
+            locator=store.locator(table=self),
+            chunks=chunks,
+            archive=archive,
+        )
@@ -1,4 +1,5 @@
 import numpy as np
+import pandas as pd
 from . import params
 from . import scrape
 from . import utils
@@ -14,7 +15,9 @@ class BoxScores(league.BoxScores):
             date_to=params.DateTo.default(),
             counter=params.NBACounter.default(),
             sorter=params.Sorter.default(),
-            sort_direction=params.SortDirection.default()):
+            sort_direction=params.SortDirection.default(),
+            incremental=False,
+            compact=False):
         super().__init__(
             scraper=scraper,
             season=season,
@@ -25,6 +28,8 @@ class BoxScores(league.BoxScores):
             counter=counter,
             sorter=sorter,
             sort_direction=sort_direction,
+            incremental=incremental,
+            compact=compact,
         )
         self._additional_formatting()
 
@@ -54,40 +59,84 @@ class BoxScores(league.BoxScores):
 
     @property
     def team_records(self):
-        df = super().matchups
+        # Teams in order of their first home game, as in matchups
+        home_games = self.data[self.data['home_road'] == 'H']
         info = (
-            df[['season', 'season_type', 'team_id_h', 'team_abbr_h']]
-            .drop_duplicates(subset=['team_abbr_h'])
+            home_games[['team_abbr', 'season', 'season_type', 'team_id']]
+            .drop_duplicates(subset=['team_abbr'])
+            .set_index(['team_abbr'])
         )
-        info = info.rename(columns={
-            'team_id_h': 'team_id',
-            'team_abbr_h': 'team_abbr'
-        }).set_index(['team_abbr'])
-        home = (
-            df.groupby(['team_abbr_h'])['win_loss_h']
-            .value_counts()
-            .unstack()
+        df = (
+            BoxScores._record_counts(self.data)
+            .drop(columns=['date'])
+            .groupby(['team_abbr'], observed=True)
+            .sum()
         )
-        road = (
-            df.groupby(['team_abbr_r'])['win_loss_r']
-            .value_counts()
-            .unstack()
+        df = BoxScores._record_totals(df)
+        df = info.join(df)
+        df = df.reset_index()
+        return df
+
+    def standings_timeline(self):
+        """Cumulative team records as of the end of every game date."""
+        info = (
+            self.data[['team_abbr', 'season', 'season_type', 'team_id']]
+            .drop_duplicates(subset=['team_abbr'])
+            .set_index(['team_abbr'])
+        )
+        df = (
+            BoxScores._record_counts(self.data)
+            .groupby(['date', 'team_abbr'], observed=True)
+            .sum()
+        )
+        # Every team has a row for every date, even if it did not play
+        dates = df.index.get_level_values('date').unique().sort_values()
+        abbrs = df.index.get_level_values('team_abbr').unique().sort_values()
+        grid = pd.MultiIndex.from_product(
+            [dates, abbrs],
+            names=['date', 'team_abbr'],
         )
-        df = home.join(road, lsuffix='_h', rsuffix='_r').reset_index()
-        df = df.rename(columns={
-            'team_abbr_h': 'team_abbr',
-            'L_h': 'home_losses',
-            'W_h': 'home_wins',
-            'L_r': 'road_losses',
-            'W_r': 'road_wins',
+        df = df.reindex(grid, fill_value=0)
+        df = df.groupby(level='team_abbr', observed=True).cumsum()
+        df = BoxScores._record_totals(df)
+        df = df.reset_index().join(info, on='team_abbr')
+        df = utils.order_columns(
+            df,
+            first_cols=[
+                'season',
+                'season_type',
+                'date',
+                'team_id',
+                'team_abbr',
+            ],
+        )
+        return df
+
+    @staticmethod
+    def _record_counts(df):
+        """Indicator columns for home and road wins and losses by game."""
+        home = (df['home_road'] == 'H').to_numpy()
+        win = (df['win_loss'] == 'W').to_numpy()
+        return pd.DataFrame({
+            'date': df['date'].to_numpy(),
+            'team_abbr': df['team_abbr'].array,
+            'home_wins': (home & win).astype(int),
+            'home_losses': (home & ~win).astype(int),
+            'road_wins': (~home & win).astype(int),
+            'road_losses': (~home & ~win).astype(int),
         })
+
+    @staticmethod
+    def _record_totals(df):
+        """Add overall, home and road totals and winning percentages."""
+        df = df[['home_wins', 'home_losses', 'road_wins', 'road_losses']]
+        df = df.copy()
         df['wins'] = df['home_wins'] + df['road_wins']
         df['losses'] = df['home_losses'] + df['road_losses']
         df['home'] = df['home_wins'] + df['home_losses']
         df['road'] = df['road_wins'] + df['road_losses']
         df['games'] = df['wins'] + df['losses']
         cols = [
-            'team_abbr',
             'games',
             'wins',
             'losses',
@@ -98,7 +147,7 @@ class BoxScores(league.BoxScores):
             'road_wins',
             'road_losses'
         ]
-        df = df[cols].set_index(['team_abbr'])
+        df = df[cols]
         df['win_pct'] = np.where(
             df['games'] > 0,
             df['wins'] / df['games'],
@@ -114,8 +163,6 @@ class BoxScores(league.BoxScores):
             df['road_wins'] / df['road'],
             np.nan
         )
-        df = info.join(df)
-        df = df.reset_index()
         return df
 
 
@@ -2,16 +2,18 @@ import collections
 import pandas as pd
 from . import params
 from . import exceptions
+from . import league
+from . import scrape
 from .table import Table
-from . import team
 from . import utils
-from . import tqdm
 import logging
 
 log = logging.getLogger(__name__)
 
-# Singleton module variable
+# Singleton module variables
 _Data = None
+_Index = None  # Lookups by team, abbr and season, rebuilt on load
+_Loader = scrape.LazyLoader(lambda *args, **kwargs: _load(*args, **kwargs))
 
 
 class HistoricalTeam(collections.namedtuple('HistoricalTeamsRowTuple', [
@@ -31,91 +33,114 @@ class HistoricalTeam(collections.namedtuple('HistoricalTeamsRowTuple', [
     __slots__ = ()
 
 
-def data():
+def data(*, copy=False):
+    """Read-only view of the data, or a full copy if copy is True."""
     global _Data
-    return _Data.copy()
+    _Loader.ensure_loaded()
+    return _Data.copy() if copy else utils.view(_Data)
 
 
 def seasons():
     global _Data
+    _Loader.ensure_loaded()
     return (season for season in _Data['season'].unique())
 
 
 def seasons_for_id(team_id):
-    global _Data
-    return (
-        season for season in _Data.loc[_Data['team_id'] == team_id, 'season']
-    )
+    global _Index
+    _Loader.ensure_loaded()
+    return iter(_Index.values('team_id', team_id, 'season'))
 
 
 def seasons_for_abbr(team_abbr):
-    global _Data
-    return (
-        season for season in _Data.loc[_Data['abbr'] == team_abbr, 'season']
-    )
+    global _Index
+    _Loader.ensure_loaded()
+    return iter(_Index.values('abbr', team_abbr, 'season'))
 
 
 def abbrs():
     global _Data
+    _Loader.ensure_loaded()
     return (team_abbr for team_abbr in _Data['abbr'].unique())
 
 
 def ids():
     global _Data
+    _Loader.ensure_loaded()
     return (team_id for team_id in _Data['team_id'].unique())
 
 
 def data_for_id(team_id):
-    global _Data
-    return (
-        _Data[_Data['team_id'] == team_id]
-    )
+    global _Data, _Index
+    _Loader.ensure_loaded()
+    return _Data.iloc[_Index.positions('team_id', team_id)]
 
 
 def id_for_abbr(team_abbr):
-    global _Data
-    team_ids = _Data.loc[
-        _Data['abbr'] == team_abbr,
-        'team_id',
-    ].unique().tolist()
+    _Loader.ensure_loaded()
+    return _id_for_abbr(team_abbr)
+
+
+def _id_for_abbr(team_abbr):
+    global _Index
+    team_ids = set(_Index.values('abbr', team_abbr, 'team_id'))
     assert len(team_ids) == 1
-    return team_ids[0]
+    return team_ids.pop()
 
 
 def abbrs_for_season(season):
-    global _Data
-    return _Data.loc[_Data['season'] == season, 'abbr'].tolist()
+    global _Index
+    _Loader.ensure_loaded()
+    return _Index.values('season', season, 'abbr')
 
 
 def ids_for_season(season):
-    global _Data
-    return _Data.loc[_Data['season'] == season, 'team_id'].tolist()
+    global _Index
+    _Loader.ensure_loaded()
+    return _Index.values('season', season, 'team_id')
 
 
 def abbr_for_id_season(team_id, season):
-    global _Data
-    abbrs = _Data.loc[
-        (_Data['team_id'] == team_id) & (_Data['season'] == season),
-        'abbr',
-    ]
-    abbrs = abbrs.unique().tolist()
+    global _Index
+    _Loader.ensure_loaded()
+    abbrs = set(_Index.values(
+        ('team_id', 'season'), (team_id, season), 'abbr'))
     assert len(abbrs) == 1
-    return abbrs[0]
+    return abbrs.pop()
 
 
 def as_tuples(index=False):
     global _Data
+    _Loader.ensure_loaded()
     return utils.as_tuples(df=_Data, to_tuple=HistoricalTeam, index=index)
 
 
 def select(*, season, index=False, **kwargs):
-    global _Data
+    global _Data, _Index
+    _Loader.ensure_loaded()
+    if len(kwargs) == 1:
+        key, value = next(iter(kwargs.items()))
+        if (key, 'season') in _Index:
+            return _Index.row((key, 'season'), (value, season))
     df = _Data[_Data['season'] == season]
     return utils.select_row_as_tuple(
         df=df, to_tuple=HistoricalTeam, index=index, **kwargs)
 
 
-def load(scraper, *, fix_hornets):
+def load(scraper=None, *, fix_hornets=False):
+    """Load team history, with the default scraper if none is given.
+
+    Data is also loaded this way automatically on first use.
+    """
+    _Loader.load(scraper, fix_hornets=fix_hornets)
+
+
+def load_in_background(scraper=None, **kwargs):
+    """Start loading team history in a background thread."""
+    return _Loader.load_in_background(scraper, **kwargs)
+
+
+def _load(scraper, *, fix_hornets=False):
     global _Data
     table = Table(store_name='historicalteams')
     if (not scraper.force_reload
@@ -129,67 +154,97 @@ def load(scraper, *, fix_hornets):
                 data=_Data,
                 archive=scraper.archive
             )
+    _build_index()
     if fix_hornets:
-        pelicans_id = id_for_abbr('NOP')
+        pelicans_id = _id_for_abbr('NOP')
         _Data.loc[_Data['abbr'] == 'CHH', 'team_id'] = pelicans_id
+        _build_index()
+
+
+def _build_index():
+    global _Data, _Index
+    _Index = utils.RowIndex(_Data, HistoricalTeam, keys=[
+        'team_id',
+        'abbr',
+        'season',
+        ('team_id', 'season'),
+        ('abbr', 'season'),
+    ])
+
 
+def _season_abbrs(season, scraper):
+    """Unique team IDs and abbreviations from a season's team game log.
 
-def _unique_teams_for_season(df):
+    Only the needed columns are read from a stored game log. A missing
+    one is fetched, and stored for team.BoxScores to reuse.
+    """
+    table = league.game_log_table(
+        player_team_flag=params.PlayerTeamFlag.Team,
+        season=season,
+    )
+    columns = ['TEAM_ID', 'TEAM_ABBREVIATION']
+    store = scraper.store
+    if not scraper.force_reload and store and table.exists(store):
+        df = table.load(store, columns=columns)
+    else:
+        df = scraper.load(table=table)
+    if df.empty:
+        return pd.DataFrame(columns=['season', 'team_id', 'abbr'])
     df = (
-        df[['season', 'team_id', 'team_abbr']]
+        df[columns]
         .drop_duplicates()
         .rename(columns={
-            'team_abbr': 'abbr',
+            'TEAM_ID': 'team_id',
+            'TEAM_ABBREVIATION': 'abbr',
         })
-        .reset_index(drop=True)
     )
-    df['team_id'] = df['team_id'].astype(int)
-    df['season'] = df['season'].astype(int)
+    df.insert(0, 'season', season.start_year)
     return df
 
 
-def _combine_team_data(record, df):
-    abbrs = df.loc[
-        (df['team_id'] == record.team_id) & (df['season'] == record.season),
-        'abbr',
-    ].unique().tolist()
-    assert len(abbrs) == 1
-    abbr = abbrs[0]
-    return collections.OrderedDict({
-        'season': record.season,
-        'team_id': record.team_id,
-        'abbr': abbr,
-        'city': record.city,
-        'name': record.name,
-        'full_name': f'{record.city} {record.name}',
-        'wins': record.wins,
-        'losses': record.losses,
-        'conf_rank': record.conf_rank,
-        'conf_count': record.conf_count,
-        'div_rank': record.div_rank,
-        'div_count': record.div_count,
-        'playoff_wins': record.playoff_wins,
-        'playoff_losses': record.playoff_losses,
-        'finals': record.finals,
-    })
-
-
 def _scrape_teams(scraper):
-    team_abbrs = pd.concat({
-        season.text: _unique_teams_for_season(
-            team.BoxScores(scraper=scraper, season=season).data
-        ) for season in tqdm(params.Season.stats_seasons())
-    }).reset_index(drop=True)
-    team_history = {
-        team_id: _get_team_history(team_id, scraper.session)
-        for team_id in tqdm(team_abbrs['team_id'].unique().tolist())
-    }
-    records = [
-        _combine_team_data(record, team_abbrs)
-        for team_id, team_data in team_history.items()
-        for record in team_data.itertuples(index=False)
-    ]
-    return pd.DataFrame(records)
+    team_abbrs = pd.concat(
+        scrape.map_concurrently(
+            lambda season: _season_abbrs(season, scraper),
+            params.Season.stats_seasons(),
+        ),
+        ignore_index=True,
+    )
+    team_abbrs = team_abbrs.astype({'season': int, 'team_id': int})
+    team_history = pd.concat(
+        scrape.map_concurrently(
+            lambda team_id: _get_team_history(team_id, scraper.session),
+            team_abbrs['team_id'].unique().tolist(),
+        ),
+        ignore_index=True,
+    )
+    # Each team has one abbreviation per season
+    df = team_history.merge(
+        team_abbrs,
+        on=['team_id', 'season'],
+        validate='many_to_one',
+    )
+    if len(df) < len(team_history):
+        log.warning(
+            f'{len(team_history) - len(df)} team seasons have no box scores')
+    df['full_name'] = df['city'] + ' ' + df['name']
+    return df[[
+        'season',
+        'team_id',
+        'abbr',
+        'city',
+        'name',
+        'full_name',
+        'wins',
+        'losses',
+        'conf_rank',
+        'conf_count',
+        'div_rank',
+        'div_count',
+        'playoff_wins',
+        'playoff_losses',
+        'finals',
+    ]]
 
 
 def _format_finals(s):
@@ -1,5 +1,5 @@
 import collections
-import numpy as np
+import pandas as pd
 
 
 def order_columns(df, *, first_cols, last_cols=None):
@@ -16,6 +16,16 @@ def order_columns(df, *, first_cols, last_cols=None):
     return df[cols]
 
 
+def view(df):
+    """DataFrame sharing the data of df, which cannot be used to modify df.
+
+    This is a shallow copy. Under pandas copy-on-write (always on from
+    pandas 3.0, which this package requires), writing to it copies the
+    affected data instead of changing df.
+    """
+    return df.copy(deep=False)
+
+
 def convert_tuple(to_tuple, from_tuple):
     """Converts one namedtuple type to another."""
     from_dict = from_tuple._asdict()
@@ -26,8 +36,14 @@ def convert_tuple(to_tuple, from_tuple):
 
 def as_tuples(df, to_tuple, index=False):
     """DataFrame rows as iterable of namedtuples of a given type."""
-    for row in df.itertuples(index=index):
-        yield convert_tuple(to_tuple, row)
+    fields = list(to_tuple._fields)
+    if not set(fields).issubset(df.columns):
+        for row in df.itertuples(index=index):
+            yield convert_tuple(to_tuple, row)
+        return
+    # Select and order the tuple's columns once, then zip them row-wise
+    columns = [df[field].tolist() for field in fields]
+    yield from map(to_tuple._make, zip(*columns))
 
 
 def select_row(df, **kwargs):
@@ -36,7 +52,7 @@ def select_row(df, **kwargs):
         raise ValueError('only one keyword argument permitted')
     key = list(kwargs)[0]
     value = kwargs[key]
-    row = df.copy()[df[key] == value]
+    row = df[df[key] == value]
     if len(row) > 1:
         raise ValueError(f'key {key} does not return a unique row')
     return row
@@ -48,15 +64,90 @@ def select_row_as_tuple(df, to_tuple, index=False, **kwargs):
     return list(as_tuples(row, to_tuple, index))[0]
 
 
+def row_positions(df, *columns):
+    """Map each key value (tuple if several columns) to its row positions."""
+    if len(columns) == 1:
+        keys = df[columns[0]].tolist()
+    else:
+        keys = zip(*(df[col].tolist() for col in columns))
+    positions = collections.defaultdict(list)
+    for position, key in enumerate(keys):
+        positions[key].append(position)
+    return dict(positions)
+
+
+class RowIndex():
+    """DataFrame rows as namedtuples, with hash lookups on key columns.
+
+    Keys are column names, or tuples of column names for composite keys.
+    """
+    def __init__(self, df, to_tuple, keys):
+        self._df = df
+        self._to_tuple = to_tuple
+        self._tuples = list(as_tuples(df, to_tuple))
+        self._positions = {
+            key: row_positions(df, *key) if isinstance(key, tuple)
+            else row_positions(df, key)
+            for key in keys
+        }
+
+    def __contains__(self, key):
+        return key in self._positions
+
+    def positions(self, key, value):
+        """Row positions (in DataFrame order) matching a key value."""
+        return self._positions[key].get(value, [])
+
+    def rows(self, key, value):
+        """Namedtuples for rows matching a key value."""
+        return [
+            self._tuples[position]
+            for position in self.positions(key, value)
+        ]
+
+    def values(self, key, value, field):
+        """Field values for rows matching a key value."""
+        return [getattr(row, field) for row in self.rows(key, value)]
+
+    def row(self, key, value):
+        """Single namedtuple for the row matching a key value."""
+        positions = self.positions(key, value)
+        if len(positions) > 1:
+            raise ValueError(f'key {key} does not return a unique row')
+        return self._tuples[positions[0]]
+
+    def select(self, **kwargs):
+        """Single namedtuple by field value, like select_row_as_tuple."""
+        if len(kwargs) > 1:
+            raise ValueError('only one keyword argument permitted')
+        key, value = next(iter(kwargs.items()))
+        if key not in self._positions:
+            return select_row_as_tuple(self._df, self._to_tuple, **kwargs)
+        return self.row(key, value)
+
+
+def rows_for_bytes(df, nbytes):
+    """Number of DataFrame rows taking up roughly a target number of bytes."""
+    if df.empty:
+        return 1
+    row_bytes = df.memory_usage(index=True, deep=True).sum() / len(df)
+    return max(1, int(nbytes // row_bytes))
+
+
+def chunks(df, *, rows=None, nbytes=None):
+    """Iterate over consecutive row slices (views) of a DataFrame.
+
+    Chunks have a fixed number of rows, or as many rows as fit in a target
+    number of bytes.
+    """
+    if (rows is None) == (nbytes is None):
+        raise ValueError('specify exactly one of rows or nbytes')
+    if nbytes is not None:
+        rows = rows_for_bytes(df, nbytes)
+    for start in range(0, len(df), rows):
+        yield df.iloc[start:start + rows]
+
+
 def chunkify(df, chunk_size):
     """Split a DataFrame by rows into chunks of a given size."""
-    rows = df.shape[0]
-    df = df.copy()
-    print(rows)
-    split_points = range(
-        chunk_size,
-        (rows // chunk_size + 1) * chunk_size,
-        chunk_size
-    )
-    print(split_points)
-    return np.split(df, split_points)
+    return list(chunks(df, rows=chunk_size))
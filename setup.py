@@ -29,7 +29,7 @@ LICENSE = 'MIT'  # Make sure consistent with trove classifiers below
 
 REQUIRED = [
     'numpy',
-    'pandas',
+    'pandas>=3',  # Copy-on-write, so data() views cannot modify the data
 ]
 
 setup(
@@ -44,6 +44,7 @@ setup(
     url=URL,
     packages=find_packages(exclude=['contrib', 'docs', 'tests']),
     install_requires=REQUIRED,
+    python_requires='>=3.11',  # Needed by pandas 3
     include_package_data=True,
     license=LICENSE,
     keywords='statistics sports analytics basketball NBA scrape',
@@ -52,7 +53,7 @@ setup(
         # Full list: https://pypi.python.org/pypi?%3Aaction=list_classifiers
         __status__,
         __license__,
-        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3.11',
         'Programming Language :: Python :: Implementation :: CPython',
         'Programming Language :: Python :: Implementation :: PyPy'
     ],